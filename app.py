@@ -1,22 +1,44 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 import yaml
 import os
 import json
-import glob
 import zipfile
-import io
+import tarfile
+import tempfile
+import hashlib
+import re
+import queue
+from collections import deque
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.triggers.cron import CronTrigger
+except ImportError:
+    BackgroundScheduler = None
+
 # Import our custom modules
 from utils.api_client import OpenAIREClient
 from utils.data_manager import DataManager
 from utils.alert_system import AlertSystem
 from pages import overview, organization_detail, data_source_detail, analytics
+import data_collector
 
 # Page config
 st.set_page_config(
@@ -26,6 +48,47 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# API log entries are one line each: the logging prefix followed by a compact JSON object
+API_LOG_ENTRY_LINE = re.compile(rb'^(?:\d[^{]* - [A-Z]+ - )?(\{.*\})\s*$')
+API_LOG_AVG_ENTRY_BYTES = 2048
+
+# Built log archives (one per format), reused until a log file changes
+LOG_ARCHIVE_DIR = Path(tempfile.gettempdir()) / "dutch_monitor_log_archives"
+
+# Log file name prefixes and the type shown in the Log Management page
+LOG_FILE_TYPES = {
+    'api_requests_': 'API Requests',
+    'data_collection_': 'Data Collection'
+}
+
+# Units used when formatting file sizes
+FILE_SIZE_UNITS = np.array(["B", "KB", "MB", "GB"])
+
+# Flattened API log fields shown in the "Recent API Requests" table, mapped to their column titles
+API_LOG_TABLE_COLUMNS = {
+    'timestamp': 'Timestamp',
+    'success': 'OK',
+    'method': 'Method',
+    'context.operation': 'Operation',
+    'status_code': 'Status',
+    'response_time_ms': 'Response Time',
+    'response_summary.total_results': 'Total Results',
+    'url': 'URL',
+    'error': 'Error'
+}
+
+# Prefer orjson for (de)serialization in the log views, fall back to stdlib json
+if orjson is not None:
+    json_loads = orjson.loads
+    
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+else:
+    json_loads = json.loads
+    
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2, default=str)
+
 # Custom CSS for styling
 st.markdown("""
 <style>
@@ -68,15 +131,58 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def load_config():
-    """Load configuration from yaml file"""
+def get_config_mtime():
+    """Get the modification time of config.yaml, used as cache key"""
+    try:
+        return os.path.getmtime('config.yaml')
+    except OSError:
+        return None
+
+@st.cache_data(show_spinner=False)
+def load_config(config_mtime):
+    """Load configuration from yaml file (config_mtime keys the cache)"""
     try:
         with open('config.yaml', 'r') as file:
-            return yaml.safe_load(file)
+            # Use the libyaml C loader when available
+            return yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
     except Exception as e:
         st.error(f"Error loading configuration: {e}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def get_open_clients():
+    """Get the API client currently in use by the app, kept across config.yaml versions"""
+    return {}
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_components(config_mtime):
+    """Create the long-lived app components once per config.yaml version"""
+    config = load_config(config_mtime)
+    api_client = OpenAIREClient(config)
+    
+    # Close the client of the previous config version (its worker threads, connections and log handler)
+    previous_client = get_open_clients().pop('api_client', None)
+    if previous_client is not None:
+        previous_client.close()
+    get_open_clients()['api_client'] = api_client
+    
+    return api_client, DataManager(), AlertSystem()
+
+@st.cache_resource(show_spinner=False)
+def start_collection_scheduler():
+    """Start the in-app daily data collection at 2 AM (once per server process)"""
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(
+        data_collector.main,
+        CronTrigger(hour=2, minute=0),
+        id='daily_collection',
+        max_instances=1,
+        coalesce=True
+    )
+    scheduler.start()
+    return scheduler
+
+@st.cache_data(ttl=30, show_spinner=False)
 def get_log_files():
     """Get list of available log files"""
     try:
@@ -84,125 +190,199 @@ def get_log_files():
         if not logs_dir.exists():
             return []
         
+        # Single directory pass; DirEntry.stat() is cached so each file is stat'ed once
         log_files = []
+        with os.scandir(logs_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.log') or not entry.is_file():
+                    continue
+                for prefix, log_type in LOG_FILE_TYPES.items():
+                    if entry.name.startswith(prefix):
+                        stat = entry.stat(follow_symlinks=False)
+                        log_files.append({
+                            'name': entry.name,
+                            'path': str(logs_dir / entry.name),
+                            'type': log_type,
+                            'size': stat.st_size,
+                            'mtime_ts': stat.st_mtime,
+                            'date': entry.name[len(prefix):-len('.log')]
+                        })
+                        break
         
-        # Get API request logs
-        api_logs = list(logs_dir.glob("api_requests_*.log"))
-        for log_file in api_logs:
-            log_files.append({
-                'name': log_file.name,
-                'path': str(log_file),
-                'type': 'API Requests',
-                'size': log_file.stat().st_size,
-                'modified': datetime.fromtimestamp(log_file.stat().st_mtime),
-                'date': log_file.name.replace('api_requests_', '').replace('.log', '')
-            })
-        
-        # Get data collection logs
-        data_logs = list(logs_dir.glob("data_collection_*.log"))
-        for log_file in data_logs:
-            log_files.append({
-                'name': log_file.name,
-                'path': str(log_file),
-                'type': 'Data Collection',
-                'size': log_file.stat().st_size,
-                'modified': datetime.fromtimestamp(log_file.stat().st_mtime),
-                'date': log_file.name.replace('data_collection_', '').replace('.log', '')
-            })
+        # Sort by modification time (newest first) on the raw float mtime;
+        # conversion to datetime is deferred to display time
+        log_files.sort(key=itemgetter('mtime_ts'), reverse=True)
         
-        # Sort by modification time (newest first)
-        log_files.sort(key=lambda x: x['modified'], reverse=True)
         return log_files
         
     except Exception as e:
         st.error(f"Error getting log files: {e}")
         return []
 
-def read_log_file(file_path, max_lines=1000):
-    """Read log file content with optional line limit"""
+@st.cache_data(ttl=60, show_spinner=False)
+def read_log_file(file_path, mtime, max_lines=1000):
+    """Read the last max_lines of a log file without loading the whole file (mtime keys the cache)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        chunk_size = 64 * 1024
+        with open(file_path, 'rb') as f:
+            # Read backwards in chunks until we have enough lines (like tail -n)
+            f.seek(0, os.SEEK_END)
+            file_size = position = f.tell()
+            chunks = []
+            newlines = 0
+            while position > 0 and newlines <= max_lines:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                f.seek(position)
+                chunk = f.read(read_size)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+            
+            tail_lines = b''.join(reversed(chunks)).decode('utf-8', errors='replace').splitlines(keepends=True)
             
-        if len(lines) > max_lines:
+            # Without reading the rest of the file, the total is estimated from the tail's bytes per line
+            total_estimated = position > 0
+            if total_estimated:
+                total_lines = round(file_size * len(tail_lines) / (file_size - position))
+            else:
+                total_lines = len(tail_lines)
+        
+        if total_lines > max_lines:
             return {
-                'content': ''.join(lines[-max_lines:]),
+                'content': ''.join(tail_lines[-max_lines:]),
                 'truncated': True,
-                'total_lines': len(lines),
+                'total_lines': total_lines,
+                'total_estimated': total_estimated,
                 'shown_lines': max_lines
             }
         else:
             return {
-                'content': ''.join(lines),
+                'content': ''.join(tail_lines),
                 'truncated': False,
-                'total_lines': len(lines),
-                'shown_lines': len(lines)
+                'total_lines': total_lines,
+                'total_estimated': False,
+                'shown_lines': total_lines
             }
     except Exception as e:
         return {
             'content': f"Error reading file: {e}",
             'truncated': False,
             'total_lines': 0,
+            'total_estimated': False,
             'shown_lines': 0
         }
 
-def parse_api_log_entries(file_path, max_entries=50):
-    """Parse API log entries from JSON-formatted log file"""
-    try:
-        entries = []
-        current_entry = ""
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('{'):
-                    # Start of new JSON entry
-                    if current_entry:
-                        try:
-                            entry = json.loads(current_entry)
-                            entries.append(entry)
-                            if len(entries) >= max_entries:
-                                break
-                        except json.JSONDecodeError:
-                            pass
-                    current_entry = line
-                elif current_entry:
-                    current_entry += line
-            
-            # Process last entry
-            if current_entry:
-                try:
-                    entry = json.loads(current_entry)
-                    entries.append(entry)
-                except json.JSONDecodeError:
-                    pass
-        
-        return entries[-max_entries:] if len(entries) > max_entries else entries
-        
-    except Exception as e:
-        st.error(f"Error parsing API log entries: {e}")
-        return []
+def _iter_api_log_entries(lines):
+    """Yield JSON entries from raw API log lines, skipping malformed records"""
+    for line in lines:
+        match = API_LOG_ENTRY_LINE.match(line)
+        if match:
+            try:
+                yield json_loads(match.group(1))
+            except ValueError:
+                pass
 
-def create_log_archive():
-    """Create a ZIP archive of all log files"""
-    try:
-        logs_dir = Path("logs")
-        if not logs_dir.exists():
-            return None
+@st.cache_data(ttl=60, show_spinner=False)
+def parse_api_log_entries(file_path, mtime, max_entries=50):
+    """Parse the last max_entries API log entries from JSON-formatted log file (mtime keys the cache)"""
+    tail_bytes = 2 * max_entries * API_LOG_AVG_ENTRY_BYTES
+    
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
         
-        # Create in-memory ZIP file
-        zip_buffer = io.BytesIO()
+        if file_size > tail_bytes:
+            # Fast path: only parse the end of the file; the first (partial) line is skipped
+            f.seek(file_size - tail_bytes)
+            f.readline()
+            entries = deque(_iter_api_log_entries(f), maxlen=max_entries)
+            if len(entries) >= max_entries:
+                return list(entries)
         
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for log_file in logs_dir.glob("*.log"):
+        f.seek(0)
+        entries = deque(_iter_api_log_entries(f), maxlen=max_entries)
+    
+    return list(entries)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_api_log_metrics(file_path, mtime, max_entries=50):
+    """Get success/failure counts and average response time for the parsed API log entries"""
+    entries = parse_api_log_entries(file_path, mtime, max_entries)
+    count = len(entries)
+    success = np.fromiter((e.get('success') is True for e in entries), dtype=np.bool_, count=count)
+    response_times = np.fromiter((e.get('response_time_ms') or 0 for e in entries), dtype=np.float32, count=count)
+    
+    return {
+        'success_count': int(success.sum()),
+        'failed_count': int(count - success.sum()),
+        'avg_response_time': float(response_times.mean()) if count else 0.0
+    }
+
+@st.cache_resource
+def get_archive_executor():
+    """Get the background executor used to build log archives off the script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="log-archive")
+
+def create_log_archive(archive_file, archive_format="zip", progress_queue=None):
+    """Write an archive of all log files (ZIP, or tar.zst when zstandard is available) to a binary file"""
+    log_paths = list(Path("logs").glob("*.log"))
+    
+    if archive_format == "tar.zst" and zstandard is not None:
+        # Multi-threaded zstd level 3 is much faster than deflate at a similar ratio
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        with compressor.stream_writer(archive_file, closefd=False) as zst_stream:
+            with tarfile.open(fileobj=zst_stream, mode='w|') as tar_file:
+                for i, log_file in enumerate(log_paths, 1):
+                    tar_file.add(log_file, arcname=log_file.name)
+                    if progress_queue is not None:
+                        progress_queue.put((i, len(log_paths)))
+    else:
+        # Level-1 deflate is several times faster than the default on log text
+        with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            for i, log_file in enumerate(log_paths, 1):
                 zip_file.write(log_file, log_file.name)
-        
-        zip_buffer.seek(0)
-        return zip_buffer.getvalue()
-        
-    except Exception as e:
-        st.error(f"Error creating log archive: {e}")
+                if progress_queue is not None:
+                    progress_queue.put((i, len(log_paths)))
+
+def get_log_archive_signature():
+    """Get a (name, mtime, size) tuple for every log file, used to key the archive cache"""
+    logs_dir = Path("logs")
+    if not logs_dir.exists():
+        return ()
+    
+    with os.scandir(logs_dir) as it:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime, entry.stat().st_size)
+            for entry in it if entry.name.endswith('.log') and entry.is_file()
+        ))
+
+def get_log_archive(archive_format, log_signature, progress_queue=None):
+    """Get the path of the log archive on disk, only rebuilt when a log file changed (log_signature keys it)"""
+    if not Path("logs").exists():
         return None
+    
+    signature_hash = hashlib.sha1(repr(log_signature).encode()).hexdigest()[:16]
+    archive_path = LOG_ARCHIVE_DIR / f"logs_{signature_hash}.{archive_format}"
+    if archive_path.exists():
+        return archive_path
+    
+    # Built under a temporary name, so a concurrent request never serves a partial archive
+    LOG_ARCHIVE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=LOG_ARCHIVE_DIR, suffix='.tmp', delete=False) as archive_file:
+        try:
+            create_log_archive(archive_file, archive_format, progress_queue)
+        except Exception:
+            archive_file.close()
+            os.unlink(archive_file.name)
+            raise
+    os.replace(archive_file.name, archive_path)
+    
+    # Archives of earlier log versions are stale
+    for old_path in LOG_ARCHIVE_DIR.glob(f"logs_*.{archive_format}"):
+        if old_path != archive_path:
+            old_path.unlink(missing_ok=True)
+    
+    return archive_path
 
 def format_file_size(size_bytes):
     """Format file size in human readable format"""
@@ -215,21 +395,37 @@ def format_file_size(size_bytes):
         i += 1
     return f"{size_bytes:.1f} {size_names[i]}"
 
+def format_file_sizes(sizes):
+    """Vectorized format_file_size for a column of byte counts"""
+    sizes = np.asarray(sizes, dtype=np.float64)
+    units = np.clip(np.log2(np.maximum(sizes, 1)) // 10, 0, len(FILE_SIZE_UNITS) - 1).astype(int)
+    scaled = sizes / 1024.0 ** units
+    return ["0B" if size == 0 else f"{value:.1f} {unit}"
+            for size, value, unit in zip(sizes, scaled, FILE_SIZE_UNITS[units])]
+
 def initialize_app():
     """Initialize the application components"""
     # Load configuration
-    config = load_config()
+    config_mtime = get_config_mtime()
+    config = load_config(config_mtime)
     if not config:
         st.error("Failed to load configuration. Please check config.yaml file.")
         st.stop()
     
-    # Initialize components
-    api_client = OpenAIREClient(config)
-    data_manager = DataManager()
-    alert_system = AlertSystem()
+    # Initialize components (cached across reruns, rebuilt when config.yaml changes)
+    api_client, data_manager, alert_system = get_components(config_mtime)
+    
+    # Scheduled collection inside the app, for hosts without crond (setup_cron.py otherwise)
+    if config.get('in_app_collection') and BackgroundScheduler is not None:
+        start_collection_scheduler()
     
     return config, api_client, data_manager, alert_system
 
+@st.cache_data(ttl=15, show_spinner=False)
+def get_sidebar_alerts(_alert_system):
+    """Get the rendered text of the top 3 active alerts for the sidebar"""
+    return tuple(f"**{alert.type}**: {alert.message}" for alert in _alert_system.get_active_alerts()[:3])
+
 def main():
     # Initialize app components
     config, api_client, data_manager, alert_system = initialize_app()
@@ -246,11 +442,11 @@ def main():
     st.sidebar.title("Navigation")
     
     # Check for alerts
-    alerts = alert_system.get_active_alerts()
-    if alerts:
+    sidebar_alerts = get_sidebar_alerts(alert_system)
+    if sidebar_alerts:
         st.sidebar.markdown("### 🚨 Active Alerts")
-        for alert in alerts[:3]:  # Show top 3 alerts
-            st.sidebar.error(f"**{alert['type']}**: {alert['message']}")
+        for alert_text in sidebar_alerts:
+            st.sidebar.error(alert_text)
     
     # Navigation menu
     page_options = {
@@ -297,7 +493,8 @@ def main():
                         st.sidebar.success("✅ Data refreshed successfully!")
                         status_text.text("Data collection completed.")
                         
-                        # Show collection summary
+                        # Show collection summary (new logs were just written)
+                        get_log_files.clear()
                         log_files = get_log_files()
                         if log_files:
                             latest_log = log_files[0]
@@ -328,245 +525,326 @@ def main():
     elif page == "settings":
         show_settings_page(config, data_manager)
 
-def show_log_management_page():
-    """Show comprehensive log management and monitoring page"""
-    st.header("📝 Log Management & Monitoring")
-    
-    # Get available log files
-    log_files = get_log_files()
-    
-    if not log_files:
-        st.warning("No log files found. Logs will appear after data collection runs.")
-        return
+def render_summary(log_files):
+    """Render the log file summary metrics"""
+    # Build the log file table once and aggregate it column-wise
+    df_logs = pd.DataFrame(log_files)
+    type_counts = df_logs['type'].value_counts()
     
     # Log file summary
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_files = len(log_files)
+        total_files = len(df_logs)
         st.metric("Total Log Files", total_files)
     
     with col2:
-        total_size = sum(log['size'] for log in log_files)
+        total_size = int(df_logs['size'].sum())
         st.metric("Total Size", format_file_size(total_size))
     
     with col3:
-        api_logs = [log for log in log_files if log['type'] == 'API Requests']
-        st.metric("API Request Logs", len(api_logs))
+        st.metric("API Request Logs", int(type_counts.get('API Requests', 0)))
     
     with col4:
-        data_logs = [log for log in log_files if log['type'] == 'Data Collection']
-        st.metric("Data Collection Logs", len(data_logs))
+        st.metric("Data Collection Logs", int(type_counts.get('Data Collection', 0)))
+
+@st.fragment
+def render_files_tab(log_files):
+    """Render the log files table with type/date filters"""
+    df_logs = pd.DataFrame(log_files)
     
-    st.divider()
+    st.subheader("Available Log Files")
     
-    # Create tabs for different views
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Log Files", "🔍 Log Viewer", "📊 API Requests", "📥 Downloads"])
+    # Filter options
+    col1, col2 = st.columns(2)
+    with col1:
+        log_type_filter = st.selectbox(
+            "Filter by Type", 
+            ["All", "API Requests", "Data Collection"]
+        )
     
-    with tab1:
-        st.subheader("Available Log Files")
-        
-        # Filter options
-        col1, col2 = st.columns(2)
-        with col1:
-            log_type_filter = st.selectbox(
-                "Filter by Type", 
-                ["All", "API Requests", "Data Collection"]
-            )
-        
-        with col2:
-            date_filter = st.date_input(
-                "Filter by Date (optional)",
-                value=None,
-                help="Filter logs by specific date"
-            )
+    with col2:
+        date_filter = st.date_input(
+            "Filter by Date (optional)",
+            value=None,
+            help="Filter logs by specific date"
+        )
+    
+    # Apply filters
+    filtered_logs = df_logs
+    if log_type_filter != "All":
+        filtered_logs = filtered_logs[filtered_logs['type'] == log_type_filter]
+    
+    if date_filter:
+        date_str = date_filter.strftime('%Y%m%d')
+        filtered_logs = filtered_logs[filtered_logs['date'].str.contains(date_str, regex=False)]
+    
+    # Display log files table
+    if not filtered_logs.empty:
+        filtered_logs = filtered_logs.copy()
+        filtered_logs['Size'] = format_file_sizes(filtered_logs['size'].to_numpy())
+        # Local time per file (fromtimestamp applies the UTC offset in effect at that moment, across DST changes)
+        filtered_logs['Modified'] = [
+            datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S') for mtime in filtered_logs['mtime_ts'].tolist()
+        ]
         
-        # Apply filters
-        filtered_logs = log_files
-        if log_type_filter != "All":
-            filtered_logs = [log for log in filtered_logs if log['type'] == log_type_filter]
+        display_df = filtered_logs[['name', 'type', 'Size', 'Modified']].rename(columns={
+            'name': 'File Name',
+            'type': 'Type',
+            'Modified': 'Last Modified'
+        })
         
-        if date_filter:
-            date_str = date_filter.strftime('%Y%m%d')
-            filtered_logs = [log for log in filtered_logs if date_str in log['date']]
+        st.dataframe(display_df, use_container_width=True)
+    else:
+        st.info("No log files match the selected filters.")
+
+@st.fragment
+def render_viewer_tab(log_files):
+    """Render the log file viewer"""
+    st.subheader("Log File Viewer")
+    
+    if log_files:
+        # Select log file to view
+        selected_log = st.selectbox(
+            "Select log file to view",
+            options=[f"{log['name']} ({log['type']}, {format_file_size(log['size'])})" for log in log_files],
+            format_func=lambda x: x
+        )
         
-        # Display log files table
-        if filtered_logs:
-            df_logs = pd.DataFrame(filtered_logs)
-            df_logs['Size'] = df_logs['size'].apply(format_file_size)
-            df_logs['Modified'] = df_logs['modified'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        if selected_log:
+            # Find selected log
+            log_name = selected_log.split(' (')[0]
+            selected_log_info = next((log for log in log_files if log['name'] == log_name), None)
             
-            display_df = df_logs[['name', 'type', 'Size', 'Modified']].rename(columns={
-                'name': 'File Name',
-                'type': 'Type',
-                'Modified': 'Last Modified'
-            })
-            
-            st.dataframe(display_df, use_container_width=True)
-        else:
-            st.info("No log files match the selected filters.")
+            if selected_log_info:
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    max_lines = st.slider("Max lines to display", 100, 5000, 1000)
+                
+                with col2:
+                    # Download individual file button (file is only read when clicked)
+                    st.download_button(
+                        label="📥 Download File",
+                        data=lambda path=selected_log_info['path']: Path(path).read_bytes(),
+                        file_name=selected_log_info['name'],
+                        mime="text/plain"
+                    )
+                
+                # Read and display log content
+                log_mtime = os.path.getmtime(selected_log_info['path'])
+                log_content = read_log_file(selected_log_info['path'], log_mtime, max_lines)
+                
+                if log_content['truncated']:
+                    about = "about " if log_content['total_estimated'] else ""
+                    st.warning(f"⚠️ Showing last {log_content['shown_lines']} lines of {about}{log_content['total_lines']:,} total lines")
+                
+                st.text_area(
+                    f"Content of {selected_log_info['name']}",
+                    value=log_content['content'],
+                    height=400,
+                    disabled=True
+                )
+
+@st.fragment
+def render_api_tab(log_files):
+    """Render the API request log analysis"""
+    st.subheader("API Request Analysis")
     
-    with tab2:
-        st.subheader("Log File Viewer")
+    # Get API log files
+    api_log_files = [log for log in log_files if log['type'] == 'API Requests']
+    
+    if api_log_files:
+        selected_api_log = st.selectbox(
+            "Select API log file",
+            options=[f"{log['name']} ({format_file_size(log['size'])})" for log in api_log_files]
+        )
         
-        if log_files:
-            # Select log file to view
-            selected_log = st.selectbox(
-                "Select log file to view",
-                options=[f"{log['name']} ({log['type']}, {format_file_size(log['size'])})" for log in log_files],
-                format_func=lambda x: x
-            )
+        if selected_api_log:
+            api_log_name = selected_api_log.split(' (')[0]
+            selected_api_log_info = next((log for log in api_log_files if log['name'] == api_log_name), None)
             
-            if selected_log:
-                # Find selected log
-                log_name = selected_log.split(' (')[0]
-                selected_log_info = next((log for log in log_files if log['name'] == log_name), None)
+            if selected_api_log_info:
+                # Parse API log entries
+                with st.spinner("Parsing API log entries..."):
+                    try:
+                        api_log_mtime = os.path.getmtime(selected_api_log_info['path'])
+                        entries = parse_api_log_entries(selected_api_log_info['path'], api_log_mtime, max_entries=100)
+                    except Exception as e:
+                        st.error(f"Error parsing API log entries: {e}")
+                        entries = []
                 
-                if selected_log_info:
-                    col1, col2 = st.columns([3, 1])
+                if entries:
+                    st.success(f"Found {len(entries)} API request entries")
                     
-                    with col1:
-                        max_lines = st.slider("Max lines to display", 100, 5000, 1000)
+                    # Summary metrics
+                    metrics = get_api_log_metrics(selected_api_log_info['path'], api_log_mtime, max_entries=100)
                     
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Successful Requests", metrics['success_count'])
                     with col2:
-                        # Download individual file button
-                        if st.button("📥 Download File"):
-                            try:
-                                with open(selected_log_info['path'], 'rb') as f:
-                                    st.download_button(
-                                        label=f"Download {selected_log_info['name']}",
-                                        data=f.read(),
-                                        file_name=selected_log_info['name'],
-                                        mime="text/plain"
-                                    )
-                            except Exception as e:
-                                st.error(f"Error preparing download: {e}")
+                        st.metric("Failed Requests", metrics['failed_count'])
+                    with col3:
+                        st.metric("Avg Response Time", f"{metrics['avg_response_time']:.1f}ms")
                     
-                    # Read and display log content
-                    log_content = read_log_file(selected_log_info['path'], max_lines)
+                    # Display entries
+                    st.subheader("Recent API Requests")
                     
-                    if log_content['truncated']:
-                        st.warning(f"⚠️ Showing last {log_content['shown_lines']} lines of {log_content['total_lines']} total lines")
+                    # One table for all entries (newest first) instead of an expander per entry
+                    recent_entries = entries[::-1]
+                    entries_df = pd.json_normalize(recent_entries, max_level=1).reindex(columns=list(API_LOG_TABLE_COLUMNS))
+                    entries_df = entries_df.rename(columns=API_LOG_TABLE_COLUMNS)
                     
-                    st.text_area(
-                        f"Content of {selected_log_info['name']}",
-                        value=log_content['content'],
-                        height=400,
-                        disabled=True
+                    table_event = st.dataframe(
+                        entries_df,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "OK": st.column_config.CheckboxColumn("OK"),
+                            "Response Time": st.column_config.NumberColumn("Response Time", format="%.1f ms")
+                        },
+                        on_select="rerun",
+                        selection_mode="single-row",
+                        key="api_log_entries_table"
                     )
-    
-    with tab3:
-        st.subheader("API Request Analysis")
-        
-        # Get API log files
-        api_log_files = [log for log in log_files if log['type'] == 'API Requests']
-        
-        if api_log_files:
-            selected_api_log = st.selectbox(
-                "Select API log file",
-                options=[f"{log['name']} ({format_file_size(log['size'])})" for log in api_log_files]
-            )
-            
-            if selected_api_log:
-                api_log_name = selected_api_log.split(' (')[0]
-                selected_api_log_info = next((log for log in api_log_files if log['name'] == api_log_name), None)
-                
-                if selected_api_log_info:
-                    # Parse API log entries
-                    with st.spinner("Parsing API log entries..."):
-                        entries = parse_api_log_entries(selected_api_log_info['path'], max_entries=100)
                     
-                    if entries:
-                        st.success(f"Found {len(entries)} API request entries")
-                        
-                        # Summary metrics
-                        success_count = sum(1 for entry in entries if entry.get('success', False))
-                        failed_count = len(entries) - success_count
-                        avg_response_time = sum(entry.get('response_time_ms', 0) for entry in entries) / len(entries)
-                        
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Successful Requests", success_count)
-                        with col2:
-                            st.metric("Failed Requests", failed_count)
-                        with col3:
-                            st.metric("Avg Response Time", f"{avg_response_time:.1f}ms")
-                        
-                        # Display entries
-                        st.subheader("Recent API Requests")
-                        
-                        for i, entry in enumerate(reversed(entries[-10:])):  # Show last 10 entries
-                            with st.expander(
-                                f"{'✅' if entry.get('success') else '❌'} {entry.get('method', 'GET')} - "
-                                f"{entry.get('context', {}).get('operation', 'Unknown')} "
-                                f"({entry.get('response_time_ms', 0):.1f}ms)"
-                            ):
-                                col1, col2 = st.columns(2)
+                    # Details for the selected row only
+                    selected_rows = table_event.selection.rows
+                    if selected_rows:
+                        entry = recent_entries[selected_rows[0]]
+                        with st.expander(
+                            f"{'✅' if entry.get('success') else '❌'} {entry.get('method', 'GET')} - "
+                            f"{entry.get('context', {}).get('operation', 'Unknown')} "
+                            f"({entry.get('response_time_ms') or 0:.1f}ms)",
+                            expanded=True
+                        ):
+                            col1, col2 = st.columns(2)
+                            
+                            with col1:
+                                st.write("**Request Details:**")
+                                st.code(f"URL: {entry.get('url', 'N/A')}")
+                                st.code(f"Method: {entry.get('method', 'N/A')}")
+                                if entry.get('parameters'):
+                                    st.code(f"Parameters: {json_pretty(entry['parameters'])}")
+                            
+                            with col2:
+                                st.write("**Response Details:**")
+                                st.code(f"Status Code: {entry.get('status_code', 'N/A')}")
+                                st.code(f"Response Time: {entry.get('response_time_ms', 'N/A')}ms")
+                                if entry.get('response_summary'):
+                                    st.code(f"Summary: {json_pretty(entry['response_summary'])}")
                                 
-                                with col1:
-                                    st.write("**Request Details:**")
-                                    st.code(f"URL: {entry.get('url', 'N/A')}")
-                                    st.code(f"Method: {entry.get('method', 'N/A')}")
-                                    if entry.get('parameters'):
-                                        st.code(f"Parameters: {json.dumps(entry['parameters'], indent=2)}")
-                                
-                                with col2:
-                                    st.write("**Response Details:**")
-                                    st.code(f"Status Code: {entry.get('status_code', 'N/A')}")
-                                    st.code(f"Response Time: {entry.get('response_time_ms', 'N/A')}ms")
-                                    if entry.get('response_summary'):
-                                        st.code(f"Summary: {json.dumps(entry['response_summary'], indent=2)}")
-                                    
-                                    if entry.get('error'):
-                                        st.error(f"Error: {entry['error']}")
+                                if entry.get('error'):
+                                    st.error(f"Error: {entry['error']}")
                     else:
-                        st.info("No API request entries found in the selected log file.")
-        else:
-            st.info("No API request log files available.")
+                        st.caption("Select a row to see the full request and response details.")
+                else:
+                    st.info("No API request entries found in the selected log file.")
+    else:
+        st.info("No API request log files available.")
+
+@st.fragment
+def render_downloads_tab(log_files):
+    """Render the individual and archive download options"""
+    st.subheader("Download Options")
     
-    with tab4:
-        st.subheader("Download Options")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Individual Files**")
+        if log_files:
+            # One dropdown and one button instead of a button per file
+            selected_index = st.selectbox(
+                "Choose file",
+                options=range(len(log_files)),
+                format_func=lambda i: f"{log_files[i]['name']} ({format_file_size(log_files[i]['size'])})"
+            )
+            log_file = log_files[selected_index]
+            
+            # Contents are read lazily when the button is clicked, not on every rerun
+            st.download_button(
+                label=f"📥 Download {log_file['name']}",
+                data=lambda path=log_file['path']: Path(path).read_bytes(),
+                file_name=log_file['name'],
+                mime="text/plain",
+                key="download_selected_log"
+            )
+    
+    with col2:
+        st.write("**Complete Archive**")
         
-        col1, col2 = st.columns(2)
+        # ZIP stays the default for compatibility; tar.zst is offered when zstandard is installed
+        archive_formats = {"ZIP (.zip)": ("zip", "application/zip")}
+        if zstandard is not None:
+            archive_formats["Fast (.tar.zst)"] = ("tar.zst", "application/zstd")
+        selected_format = st.selectbox("Archive format", list(archive_formats.keys()))
+        archive_format, archive_mime = archive_formats[selected_format]
         
-        with col1:
-            st.write("**Individual Files**")
-            if log_files:
-                for log_file in log_files[:5]:  # Show first 5 files
+        if st.button("📦 Create Complete Log Archive"):
+            # Build the archive on a worker thread and report per-file progress from here
+            progress_bar = st.progress(0.0, text="Creating archive...")
+            progress_queue = queue.Queue()
+            try:
+                future = get_archive_executor().submit(
+                    get_log_archive, archive_format, get_log_archive_signature(), progress_queue
+                )
+                while not future.done():
                     try:
-                        with open(log_file['path'], 'rb') as f:
-                            st.download_button(
-                                label=f"📥 {log_file['name']} ({format_file_size(log_file['size'])})",
-                                data=f.read(),
-                                file_name=log_file['name'],
-                                mime="text/plain",
-                                key=f"download_{log_file['name']}"
-                            )
-                    except Exception as e:
-                        st.error(f"Error with {log_file['name']}: {e}")
-                
-                if len(log_files) > 5:
-                    st.info(f"... and {len(log_files) - 5} more files")
-        
-        with col2:
-            st.write("**Complete Archive**")
-            if st.button("📦 Create Complete Log Archive"):
-                with st.spinner("Creating archive..."):
-                    archive_data = create_log_archive()
-                    
-                    if archive_data:
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                        st.download_button(
-                            label="📥 Download Complete Archive",
-                            data=archive_data,
-                            file_name=f"dutch_monitor_logs_{timestamp}.zip",
-                            mime="application/zip"
-                        )
-                        st.success("✅ Archive created successfully!")
-                    else:
-                        st.error("❌ Failed to create archive")
+                        done, total = progress_queue.get(timeout=0.1)
+                        progress_bar.progress(done / total, text=f"Archiving file {done} of {total}...")
+                    except queue.Empty:
+                        pass
+                archive_path = future.result()
+            except Exception as e:
+                st.error(f"Error creating log archive: {e}")
+                archive_path = None
+            progress_bar.empty()
             
-            st.info("The complete archive includes all log files in a single ZIP download.")
+            if archive_path:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                # The archive is only read from disk when the download is requested
+                st.download_button(
+                    label="📥 Download Complete Archive",
+                    data=lambda path=archive_path: path.read_bytes(),
+                    file_name=f"dutch_monitor_logs_{timestamp}.{archive_format}",
+                    mime=archive_mime
+                )
+                st.success("✅ Archive created successfully!")
+            else:
+                st.error("❌ Failed to create archive")
+        
+        st.info("The complete archive includes all log files in a single download.")
+
+def show_log_management_page():
+    """Show comprehensive log management and monitoring page"""
+    st.header("📝 Log Management & Monitoring")
+    
+    # Get available log files
+    log_files = get_log_files()
+    
+    if not log_files:
+        st.warning("No log files found. Logs will appear after data collection runs.")
+        return
+    
+    render_summary(log_files)
+    
+    st.divider()
+    
+    # Create tabs for different views; each tab is a fragment so its widgets only rerun that tab
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Log Files", "🔍 Log Viewer", "📊 API Requests", "📥 Downloads"])
+    
+    with tab1:
+        render_files_tab(log_files)
+    
+    with tab2:
+        render_viewer_tab(log_files)
+    
+    with tab3:
+        render_api_tab(log_files)
+    
+    with tab4:
+        render_downloads_tab(log_files)
 
 def show_settings_page(config, data_manager):
     """Show settings and configuration page"""
@@ -10,6 +10,7 @@ import os
 from pathlib import Path
 import yaml
 import logging
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
 
 # Add the project directory to Python path
@@ -20,6 +21,11 @@ from utils.api_client import OpenAIREClient
 from utils.data_manager import DataManager
 from utils.alert_system import AlertSystem
 
+def log_backup_name(default_name):
+    """Name rotated backups data_collection_YYYYMMDD.N.log, keeping the .log suffix the log views list"""
+    base, _, number = default_name.rpartition('.')
+    return f"{base[:-len('.log')]}.{number}.log"
+
 def main():
     """Main data collection function"""
     
@@ -27,18 +33,45 @@ def main():
     log_dir = project_dir / "logs"
     log_dir.mkdir(exist_ok=True)
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / f"data_collection_{datetime.now().strftime('%Y%m%d')}.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Cap each log file so the log viewer's tail/parse cost stays bounded
+    handlers = [
+        RotatingFileHandler(
+            log_dir / f"data_collection_{datetime.now().strftime('%Y%m%d')}.log",
+            maxBytes=16 * 1024 * 1024,
+            backupCount=20
+        )
+    ]
+    handlers[0].namer = log_backup_name
+    
+    # Attached explicitly (not via basicConfig), since inside the app the root logger is already configured;
+    # console output only when nothing else writes it yet
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        handlers.append(logging.StreamHandler(sys.stdout))
     
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    previous_level = root_logger.level
+    root_logger.setLevel(logging.INFO)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+    
+    try:
+        return collect_data()
+    
+    finally:
+        # Detach this run's handlers again, so repeated in-app runs do not stack them
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+        root_logger.setLevel(previous_level)
+
+def collect_data():
+    """Collect, store and check the daily data, logging the outcome"""
     logger = logging.getLogger(__name__)
     logger.info("Starting daily data collection...")
     
+    api_client = None
     try:
         # Load configuration
         config_file = project_dir / "config.yaml"
@@ -72,7 +105,7 @@ def main():
             if alerts:
                 logger.info(f"Generated {len(alerts)} alerts")
                 for alert in alerts:
-                    logger.warning(f"Alert: {alert['type']} - {alert['organization']} - {alert['message']}")
+                    logger.warning(f"Alert: {alert.type} - {alert.organization} - {alert.message}")
             else:
                 logger.info("No alerts generated")
             
@@ -84,6 +117,11 @@ def main():
     except Exception as e:
         logger.error(f"Error in data collection: {e}")
         return False
+    
+    finally:
+        # Release the API client's pooled connections, worker threads and API log handler
+        if api_client is not None:
+            api_client.close()
 
 if __name__ == "__main__":
     success = main()
@@ -6,103 +6,202 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
 
-def show_page(data_manager):
-    """Show analytics and trends page"""
-    
-    st.header("📈 Analytics & Trends")
-    
-    # Load historical data
-    historical_data = data_manager.get_historical_data(90)  # Last 90 days
-    
+# Named aggregations for the daily time series, producing flat "<column>_<func>" names
+DAILY_AGGREGATIONS = {
+    'publications_total_sum': ('publications_total', 'sum'),
+    'publications_total_mean': ('publications_total', 'mean'),
+    'publications_recent_sum': ('publications_recent', 'sum'),
+    'publications_recent_mean': ('publications_recent', 'mean'),
+    'data_sources_count_sum': ('data_sources_count', 'sum'),
+    'data_sources_count_mean': ('data_sources_count', 'mean'),
+    'data_freshness_days_mean': ('data_freshness_days', 'mean'),
+    'organization_name_count': ('organization_name', 'count')
+}
+
+# Named aggregations for the per-group analysis
+GROUP_AGGREGATIONS = {
+    'organization_name_count': ('organization_name', 'count'),
+    'publications_total_sum': ('publications_total', 'sum'),
+    'publications_total_mean': ('publications_total', 'mean'),
+    'publications_recent_sum': ('publications_recent', 'sum'),
+    'publications_recent_mean': ('publications_recent', 'mean'),
+    'data_sources_count_sum': ('data_sources_count', 'sum'),
+    'data_sources_count_mean': ('data_sources_count', 'mean'),
+    'data_freshness_days_mean': ('data_freshness_days', 'mean')
+}
+
+# Daily aggregates each primary metric's chart needs (names from DAILY_AGGREGATIONS)
+METRIC_AGGREGATIONS = {
+    'publications_total': ['publications_total_sum', 'publications_total_mean'],
+    'publications_recent': ['publications_recent_sum'],
+    'data_sources_count': ['data_sources_count_sum'],
+    'data_freshness_days': ['data_freshness_days_mean']
+}
+
+# Columns of the daily data the analytics page uses; only these are loaded
+ANALYTICS_COLUMNS = [
+    'date', 'org_id', 'organization_name', 'acronym', 'main_grouping', 'repository_health',
+    'publications_total', 'publications_recent', 'data_sources_count', 'data_freshness_days'
+]
+
+# String columns stored as categoricals on load (integer metrics come downcast from the data manager)
+CATEGORY_COLUMNS = ['organization_name', 'acronym', 'main_grouping', 'repository_health']
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_historical_data(_data_manager, days, data_version):
+    """Load and prepare historical data (data_version keys the cache)"""
+    historical_data = _data_manager.get_historical_data(days, columns=ANALYTICS_COLUMNS)
     if historical_data.empty:
-        st.warning("No historical data available for analysis.")
-        return
-    
-    # Data preparation
-    historical_data['date'] = pd.to_datetime(historical_data['date'])
-    historical_data = historical_data.sort_values(['date', 'organization_name'])
+        return historical_data
     
-    # Time period selector
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        period_options = {
-            "Last 7 days": 7,
-            "Last 30 days": 30,
-            "Last 60 days": 60,
-            "Last 90 days": 90
-        }
-        selected_period = st.selectbox("Analysis Period", list(period_options.keys()), index=1)
-        days = period_options[selected_period]
-    
-    with col2:
-        # Metric selector
-        metric_options = {
-            "Total Publications": "publications_total",
-            "Recent Publications": "publications_recent",
-            "Data Sources Count": "data_sources_count",
-            "Data Freshness (Days)": "data_freshness_days"
-        }
-        selected_metric = st.selectbox("Primary Metric", list(metric_options.keys()))
-        metric_column = metric_options[selected_metric]
+    # Compact dtypes: categoricals for repeated strings, float32 for the freshness metric
+    for column in CATEGORY_COLUMNS:
+        if column in historical_data:
+            historical_data[column] = historical_data[column].astype('category')
+    if 'data_freshness_days' in historical_data:
+        historical_data['data_freshness_days'] = historical_data['data_freshness_days'].astype('float32')
     
+    return historical_data.sort_values(['date', 'organization_name'])
+
+def get_overview_metrics(period_data):
+    """Count monitored organizations and the healthy share from the categorical codes"""
+    org_codes = period_data['organization_name'].cat.codes.to_numpy()
+    total_orgs = np.unique(org_codes[org_codes >= 0]).size
+    
+    health = period_data['repository_health'].cat
+    if 'healthy' in health.categories:
+        healthy_code = health.categories.get_loc('healthy')
+        healthy_pct = np.mean(health.codes.to_numpy() == healthy_code) * 100
+    else:
+        healthy_pct = 0.0
+    
+    return {'total_orgs': total_orgs, 'healthy_pct': healthy_pct}
+
+def slice_period(historical_data, days):
+    """Get the rows of the last N days of historical data (which is sorted by date)"""
+    dates = historical_data['date'].to_numpy()
+    cutoff_date = dates[-1] - np.timedelta64(days, 'D')
+    # Binary search for the first row in the period instead of masking the whole frame
+    return historical_data.iloc[np.searchsorted(dates, cutoff_date, side='left'):]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_daily_aggregates(_data_manager, days, data_version, metric_column=None):
+    """Aggregate the period per day, only computing the columns the metric's chart needs (all when None)"""
+    period_data = slice_period(load_historical_data(_data_manager, 90, data_version), days)
+    
+    if metric_column is None:
+        aggregations = DAILY_AGGREGATIONS
+    else:
+        aggregations = {name: DAILY_AGGREGATIONS[name] for name in METRIC_AGGREGATIONS[metric_column]}
+    
+    # Named aggregations give flat column names directly;
+    # period_data is already sorted by date so the groupby need not sort
+    return period_data.groupby('date', sort=False).agg(**aggregations).reset_index()
+
+def compute_correlations(df, columns):
+    """Correlation matrix of the given columns, computed with np.corrcoef when there are no missing values"""
+    values = df[columns].to_numpy(np.float64)
+    if np.isnan(values).any():
+        # pandas handles missing values pairwise
+        return df[columns].corr()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlations = np.corrcoef(values, rowvar=False)
+    return pd.DataFrame(correlations, index=columns, columns=columns)
+
+def top_attention_positions(latest_data, k):
+    """Positions of the k stalest organizations with critical/warning health or data older than 14 days"""
+    freshness = latest_data['data_freshness_days'].to_numpy(np.float64, na_value=np.nan)
+    health = latest_data['repository_health'].cat
+    flagged_codes = [health.categories.get_loc(status) for status in ('critical', 'warning') if status in health.categories]
+    
+    mask = np.isin(health.codes.to_numpy(), flagged_codes) | (freshness > 14)
+    candidates = np.flatnonzero(mask)
+    # Missing freshness ranks after every known value, as with nlargest
+    freshness = np.nan_to_num(freshness, nan=-np.inf)
+    if len(candidates) > k:
+        # Find the k-th largest value in linear time; ties at that value keep the earliest rows, like nlargest
+        values = freshness[candidates]
+        kth = -np.partition(-values, k - 1)[k - 1]
+        above = values > kth
+        at_kth = np.flatnonzero(values == kth)[:k - above.sum()]
+        above[at_kth] = True
+        candidates = candidates[above]
+    return candidates[np.argsort(-freshness[candidates], kind='stable')]
+
+def get_weekly_means(period_data, first_week_end, last_week_start):
+    """Mean publications per organization in the first and last week, for organizations present in both
+    
+    Sums and counts for both weeks come from bincounts over the organization codes in one pass each,
+    instead of filtering and grouping the frame once per week.
+    """
+    org_names = period_data['organization_name'].cat
+    codes = org_names.codes.to_numpy()
+    dates = period_data['date'].to_numpy()
+    values = period_data['publications_total'].to_numpy(np.float64, na_value=np.nan)
+    has_value = ~np.isnan(values)
+    n_orgs = len(org_names.categories)
+    
+    weeks = {}
+    for column, in_week in (('First Week Avg', dates <= first_week_end), ('Last Week Avg', dates >= last_week_start)):
+        rows = in_week & (codes >= 0)
+        valued = rows & has_value
+        present = np.bincount(codes[rows], minlength=n_orgs) > 0
+        counts = np.bincount(codes[valued], minlength=n_orgs)
+        sums = np.bincount(codes[valued], weights=values[valued], minlength=n_orgs)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weeks[column] = (present, sums / counts)
+    
+    in_both = weeks['First Week Avg'][0] & weeks['Last Week Avg'][0]
+    return pd.DataFrame(
+        {column: means[in_both] for column, (_, means) in weeks.items()},
+        index=pd.Index(org_names.categories[in_both], name='organization_name')
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_period_analysis(_data_manager, days, data_version):
+    """Compute the period slice and the per-organization aggregates shown on the page for the last N days"""
     # Filter data by selected period
-    cutoff_date = historical_data['date'].max() - timedelta(days=days)
-    period_data = historical_data[historical_data['date'] >= cutoff_date]
-    
-    # Overview metrics
-    st.subheader("📊 Overview Metrics")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        total_orgs = period_data['organization_name'].nunique()
-        st.metric("Organizations Monitored", total_orgs)
-    
-    with col2:
-        total_data_points = len(period_data)
-        st.metric("Data Points Collected", f"{total_data_points:,}")
+    period_data = slice_period(load_historical_data(_data_manager, 90, data_version), days)
     
-    with col3:
-        avg_publications = period_data['publications_total'].mean()
-        st.metric("Avg Publications per Org", f"{avg_publications:.0f}")
+    # Get latest data for each organization (period_data is sorted by date, so keep each org's last row)
+    latest_data = period_data.drop_duplicates('organization_name', keep='last')
     
-    with col4:
-        healthy_pct = (period_data['repository_health'] == 'healthy').mean() * 100
-        st.metric("Healthy Repositories %", f"{healthy_pct:.1f}%")
-    
-    # Time series analysis
-    st.subheader("📈 Time Series Analysis")
-    
-    # Aggregate daily data
-    daily_aggregates = period_data.groupby('date').agg({
-        'publications_total': ['sum', 'mean'],
-        'publications_recent': ['sum', 'mean'],
-        'data_sources_count': ['sum', 'mean'],
-        'data_freshness_days': 'mean',
-        'organization_name': 'count'
-    }).round(2)
+    # Calculate correlations
+    numeric_columns = ['publications_total', 'publications_recent', 'data_sources_count', 'data_freshness_days']
+    correlation_data = compute_correlations(latest_data, numeric_columns)
     
-    # Flatten column names
-    daily_aggregates.columns = ['_'.join(col).strip() for col in daily_aggregates.columns]
-    daily_aggregates = daily_aggregates.reset_index()
+    # Analysis by main grouping
+    group_analysis = latest_data.groupby('main_grouping', observed=True).agg(**GROUP_AGGREGATIONS).reset_index()
     
-    # Create time series chart
+    return period_data, get_overview_metrics(period_data), latest_data, correlation_data, group_analysis
+
+# Figures are built once per (period, metric, data version) and reused across reruns
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_timeseries_figure(_data_manager, days, data_version, metric_column):
+    """Build the time series chart of the selected metric"""
+    # Aggregate only what the selected metric's chart plots
+    daily_aggregates = get_daily_aggregates(_data_manager, days, data_version, metric_column)
+    
+    # Create time series chart from plain numpy arrays (day-resolution dates, float32 values)
+    dates = daily_aggregates['date'].to_numpy('datetime64[D]')
     fig_timeseries = go.Figure()
     
     if metric_column == 'publications_total':
         fig_timeseries.add_trace(go.Scatter(
-            x=daily_aggregates['date'],
-            y=daily_aggregates['publications_total_sum'],
-            mode='lines+markers',
+            x=dates,
+            y=daily_aggregates['publications_total_sum'].to_numpy(np.float32),
+            mode='lines',
+            hovertemplate='%{y:,.0f}',
             name='Total Publications (Sum)',
             line=dict(color='#1f77b4', width=3)
         ))
         
         fig_timeseries.add_trace(go.Scatter(
-            x=daily_aggregates['date'],
-            y=daily_aggregates['publications_total_mean'],
-            mode='lines+markers',
+            x=dates,
+            y=daily_aggregates['publications_total_mean'].to_numpy(np.float32),
+            mode='lines',
+            hovertemplate='%{y:.2f}',
             name='Avg Publications per Org',
             line=dict(color='#ff7f0e', width=2),
             yaxis='y2'
@@ -117,9 +216,10 @@ def show_page(data_manager):
     
     elif metric_column == 'publications_recent':
         fig_timeseries.add_trace(go.Scatter(
-            x=daily_aggregates['date'],
-            y=daily_aggregates['publications_recent_sum'],
-            mode='lines+markers',
+            x=dates,
+            y=daily_aggregates['publications_recent_sum'].to_numpy(np.float32),
+            mode='lines',
+            hovertemplate='%{y:,.0f}',
             name='Recent Publications (Sum)',
             line=dict(color='#2ca02c', width=3)
         ))
@@ -132,9 +232,10 @@ def show_page(data_manager):
     
     elif metric_column == 'data_sources_count':
         fig_timeseries.add_trace(go.Scatter(
-            x=daily_aggregates['date'],
-            y=daily_aggregates['data_sources_count_sum'],
-            mode='lines+markers',
+            x=dates,
+            y=daily_aggregates['data_sources_count_sum'].to_numpy(np.float32),
+            mode='lines',
+            hovertemplate='%{y:,.0f}',
             name='Total Data Sources',
             line=dict(color='#d62728', width=3)
         ))
@@ -147,9 +248,10 @@ def show_page(data_manager):
     
     else:  # data_freshness_days
         fig_timeseries.add_trace(go.Scatter(
-            x=daily_aggregates['date'],
-            y=daily_aggregates['data_freshness_days_mean'],
-            mode='lines+markers',
+            x=dates,
+            y=daily_aggregates['data_freshness_days_mean'].to_numpy(np.float32),
+            mode='lines',
+            hovertemplate='%{y:.2f}',
             name='Avg Data Freshness',
             line=dict(color='#9467bd', width=3)
         ))
@@ -167,14 +269,140 @@ def show_page(data_manager):
         )
     
     fig_timeseries.update_layout(hovermode='x unified')
+    return fig_timeseries
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_correlation_figure(_data_manager, days, data_version):
+    """Build the correlation heatmap of the period's key metrics"""
+    correlation_data = get_period_analysis(_data_manager, days, data_version)[3]
+    fig_corr = px.imshow(
+        correlation_data,
+        text_auto=True,
+        aspect="auto",
+        title="Correlation Matrix of Key Metrics",
+        color_continuous_scale='RdBu_r'
+    )
+    fig_corr.update_layout(height=400)
+    return fig_corr
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_group_figures(_data_manager, days, data_version):
+    """Build the publications and data freshness bar charts per group"""
+    group_analysis = get_period_analysis(_data_manager, days, data_version)[4]
+    fig_group_pubs = go.Figure(go.Bar(
+        x=group_analysis['main_grouping'],
+        y=group_analysis['publications_total_sum'],
+        marker=dict(color=group_analysis['publications_total_sum'], colorscale='Blues', showscale=True)
+    ))
+    fig_group_pubs.update_layout(
+        title="Total Publications by Group",
+        xaxis_title="Group",
+        yaxis_title="Total Publications"
+    )
+    
+    fig_group_freshness = go.Figure(go.Bar(
+        x=group_analysis['main_grouping'],
+        y=group_analysis['data_freshness_days_mean'],
+        marker=dict(color=group_analysis['data_freshness_days_mean'], colorscale='Reds', showscale=True)
+    ))
+    fig_group_freshness.update_layout(
+        title="Average Data Freshness by Group",
+        xaxis_title="Group",
+        yaxis_title="Avg Days Since Update"
+    )
+    fig_group_freshness.update_yaxes(hoverformat='.2f')
+    # Add threshold line
+    fig_group_freshness.add_hline(y=14, line_dash="dash", line_color="orange", 
+                                 annotation_text="Warning threshold")
+    return fig_group_pubs, fig_group_freshness
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_export_json(daily_aggregates, latest_data, group_analysis, correlation_data, growth_df=None):
+    """Serialize the analytics frames to a JSON document using pandas' native writer"""
+    export_parts = {
+        'daily_aggregates': daily_aggregates.to_json(orient='records', date_format='iso'),
+        'latest_organization_data': latest_data.to_json(orient='records', date_format='iso'),
+        'group_analysis': group_analysis.to_json(orient='records', date_format='iso'),
+        'correlation_matrix': correlation_data.to_json(orient='columns'),
+    }
+    
+    if growth_df is not None:
+        export_parts['growth_analysis'] = growth_df.to_json(orient='records')
+    
+    return '{' + ', '.join(f'"{name}": {part}' for name, part in export_parts.items()) + '}'
+
+def show_page(data_manager):
+    """Show analytics and trends page"""
+    
+    st.header("📈 Analytics & Trends")
+    
+    # Load historical data (cached until the day changes or new data is collected)
+    data_version = (datetime.now().date(), data_manager.get_last_update_time())
+    historical_data = load_historical_data(data_manager, 90, data_version)  # Last 90 days
+    
+    if historical_data.empty:
+        st.warning("No historical data available for analysis.")
+        return
+    
+    # Time period selector
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        period_options = {
+            "Last 7 days": 7,
+            "Last 30 days": 30,
+            "Last 60 days": 60,
+            "Last 90 days": 90
+        }
+        selected_period = st.selectbox("Analysis Period", list(period_options.keys()), index=1)
+        days = period_options[selected_period]
+    
+    with col2:
+        # Metric selector
+        metric_options = {
+            "Total Publications": "publications_total",
+            "Recent Publications": "publications_recent",
+            "Data Sources Count": "data_sources_count",
+            "Data Freshness (Days)": "data_freshness_days"
+        }
+        selected_metric = st.selectbox("Primary Metric", list(metric_options.keys()))
+        metric_column = metric_options[selected_metric]
+    
+    # Period slice and aggregates, cached per period
+    period_data, overview_metrics, latest_data, correlation_data, group_analysis = get_period_analysis(
+        data_manager, days, data_version
+    )
+    
+    # Overview metrics
+    st.subheader("📊 Overview Metrics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_orgs = overview_metrics['total_orgs']
+        st.metric("Organizations Monitored", total_orgs)
+    
+    with col2:
+        total_data_points = len(period_data)
+        st.metric("Data Points Collected", f"{total_data_points:,}")
+    
+    with col3:
+        avg_publications = period_data['publications_total'].mean()
+        st.metric("Avg Publications per Org", f"{avg_publications:.0f}")
+    
+    with col4:
+        healthy_pct = overview_metrics['healthy_pct']
+        st.metric("Healthy Repositories %", f"{healthy_pct:.1f}%")
+    
+    # Time series analysis
+    st.subheader("📈 Time Series Analysis")
+    
+    fig_timeseries = make_timeseries_figure(data_manager, days, data_version, metric_column)
     st.plotly_chart(fig_timeseries, use_container_width=True)
     
     # Organization comparison
     st.subheader("🏛️ Organization Comparison")
     
-    # Get latest data for each organization
-    latest_data = period_data.groupby('organization_name').last().reset_index()
-    
     # Top performers
     col1, col2 = st.columns(2)
     
@@ -184,54 +412,27 @@ def show_page(data_manager):
             ['organization_name', 'acronym', 'publications_total', 'publications_recent']
         ]
         top_pubs.columns = ['Organization', 'Acronym', 'Total Pubs', 'Recent Pubs']
-        st.dataframe(top_pubs, hide_index=True)
+        st.dataframe(top_pubs.convert_dtypes(dtype_backend='pyarrow'), hide_index=True)
     
     with col2:
         st.subheader("⚠️ Organizations Needing Attention")
         # Organizations with critical or warning status
-        attention_needed = latest_data[
-            (latest_data['repository_health'].isin(['critical', 'warning'])) |
-            (latest_data['data_freshness_days'] > 14)
-        ].nlargest(10, 'data_freshness_days')[
+        attention_needed = latest_data.iloc[top_attention_positions(latest_data, 10)][
             ['organization_name', 'acronym', 'repository_health', 'data_freshness_days']
         ]
         attention_needed.columns = ['Organization', 'Acronym', 'Health Status', 'Days Since Update']
-        st.dataframe(attention_needed, hide_index=True)
+        st.dataframe(attention_needed.convert_dtypes(dtype_backend='pyarrow'), hide_index=True)
     
     # Correlation analysis
     st.subheader("🔗 Correlation Analysis")
     
-    # Calculate correlations
-    numeric_columns = ['publications_total', 'publications_recent', 'data_sources_count', 'data_freshness_days']
-    correlation_data = latest_data[numeric_columns].corr()
-    
     # Create correlation heatmap
-    fig_corr = px.imshow(
-        correlation_data,
-        text_auto=True,
-        aspect="auto",
-        title="Correlation Matrix of Key Metrics",
-        color_continuous_scale='RdBu_r'
-    )
-    fig_corr.update_layout(height=400)
+    fig_corr = make_correlation_figure(data_manager, days, data_version)
     st.plotly_chart(fig_corr, use_container_width=True)
     
     # Group analysis
     st.subheader("🏢 Group Analysis")
     
-    # Analysis by main grouping
-    group_analysis = latest_data.groupby('main_grouping').agg({
-        'organization_name': 'count',
-        'publications_total': ['sum', 'mean'],
-        'publications_recent': ['sum', 'mean'],
-        'data_sources_count': ['sum', 'mean'],
-        'data_freshness_days': 'mean'
-    }).round(2)
-    
-    # Flatten column names
-    group_analysis.columns = ['_'.join(col).strip() for col in group_analysis.columns]
-    group_analysis = group_analysis.reset_index()
-    
     # Rename columns for display
     display_columns = {
         'main_grouping': 'Group',
@@ -246,75 +447,48 @@ def show_page(data_manager):
     }
     
     group_analysis_display = group_analysis.rename(columns=display_columns)
-    st.dataframe(group_analysis_display, hide_index=True, use_container_width=True)
+    st.dataframe(
+        group_analysis_display.convert_dtypes(dtype_backend='pyarrow'),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            column: st.column_config.NumberColumn(column, format="%.2f")
+            for column in ['Avg Publications', 'Avg Recent Pubs', 'Avg Data Sources', 'Avg Data Freshness (Days)']
+        }
+    )
     
     # Group comparison charts
+    fig_group_pubs, fig_group_freshness = make_group_figures(data_manager, days, data_version)
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_group_pubs = px.bar(
-            group_analysis,
-            x='main_grouping',
-            y='publications_total_sum',
-            title="Total Publications by Group",
-            labels={'publications_total_sum': 'Total Publications', 'main_grouping': 'Group'},
-            color='publications_total_sum',
-            color_continuous_scale='Blues'
-        )
         st.plotly_chart(fig_group_pubs, use_container_width=True)
     
     with col2:
-        fig_group_freshness = px.bar(
-            group_analysis,
-            x='main_grouping',
-            y='data_freshness_days_mean',
-            title="Average Data Freshness by Group",
-            labels={'data_freshness_days_mean': 'Avg Days Since Update', 'main_grouping': 'Group'},
-            color='data_freshness_days_mean',
-            color_continuous_scale='Reds'
-        )
-        # Add threshold line
-        fig_group_freshness.add_hline(y=14, line_dash="dash", line_color="orange", 
-                                     annotation_text="Warning threshold")
         st.plotly_chart(fig_group_freshness, use_container_width=True)
     
     # Trend analysis
     st.subheader("📊 Trend Analysis")
     
     # Calculate growth rates
-    if len(period_data['date'].unique()) >= 7:  # Need at least a week of data
+    unique_dates = np.unique(period_data['date'].to_numpy())  # sorted
+    if len(unique_dates) >= 7:  # Need at least a week of data
         
         # Get first and last week data
-        unique_dates = sorted(period_data['date'].unique())
-        first_week_end = unique_dates[6] if len(unique_dates) > 6 else unique_dates[-1]
-        last_week_start = unique_dates[-7] if len(unique_dates) > 6 else unique_dates[0]
+        first_week_end = unique_dates[6]
+        last_week_start = unique_dates[-7]
         
-        first_week_data = period_data[period_data['date'] <= first_week_end].groupby('organization_name').agg({
-            'publications_total': 'mean'
-        })
-        
-        last_week_data = period_data[period_data['date'] >= last_week_start].groupby('organization_name').agg({
-            'publications_total': 'mean'
-        })
+        # Weekly means per organization (only orgs present in both weeks)
+        growth_df = get_weekly_means(period_data, first_week_end, last_week_start)
+        growth_df = growth_df[growth_df['First Week Avg'] > 0]
         
         # Calculate growth rates
-        growth_data = []
-        for org in first_week_data.index:
-            if org in last_week_data.index:
-                first_val = first_week_data.loc[org, 'publications_total']
-                last_val = last_week_data.loc[org, 'publications_total']
-                
-                if first_val > 0:
-                    growth_rate = ((last_val - first_val) / first_val) * 100
-                    growth_data.append({
-                        'Organization': org,
-                        'First Week Avg': first_val,
-                        'Last Week Avg': last_val,
-                        'Growth Rate (%)': growth_rate
-                    })
+        growth_df = growth_df.assign(**{
+            'Growth Rate (%)': (growth_df['Last Week Avg'] - growth_df['First Week Avg']) / growth_df['First Week Avg'] * 100
+        })
         
-        if growth_data:
-            growth_df = pd.DataFrame(growth_data)
+        if not growth_df.empty:
+            growth_df = growth_df.rename_axis('Organization').reset_index()
             growth_df = growth_df.sort_values('Growth Rate (%)', ascending=False)
             
             col1, col2 = st.columns(2)
@@ -322,32 +496,24 @@ def show_page(data_manager):
             with col1:
                 st.subheader("📈 Fastest Growing Organizations")
                 top_growth = growth_df.head(10)
-                st.dataframe(top_growth, hide_index=True)
+                st.dataframe(top_growth.convert_dtypes(dtype_backend='pyarrow'), hide_index=True)
             
             with col2:
                 st.subheader("📉 Declining Organizations")
                 declining = growth_df[growth_df['Growth Rate (%)'] < 0].head(10)
                 if not declining.empty:
-                    st.dataframe(declining, hide_index=True)
+                    st.dataframe(declining.convert_dtypes(dtype_backend='pyarrow'), hide_index=True)
                 else:
                     st.info("No declining organizations detected in this period.")
     
     # Export analytics data
     if st.button("📥 Export Analytics Data"):
         
-        # Prepare comprehensive analytics export
-        export_data = {
-            'daily_aggregates': daily_aggregates.to_dict('records'),
-            'latest_organization_data': latest_data.to_dict('records'),
-            'group_analysis': group_analysis.to_dict('records'),
-            'correlation_matrix': correlation_data.to_dict(),
-        }
-        
-        if 'growth_df' in locals():
-            export_data['growth_analysis'] = growth_df.to_dict('records')
-        
-        import json
-        json_str = json.dumps(export_data, indent=2, default=str)
+        # Prepare comprehensive analytics export (cached on the frames' contents)
+        json_str = build_export_json(
+            get_daily_aggregates(data_manager, days, data_version), latest_data, group_analysis, correlation_data,
+            growth_df if 'growth_df' in locals() else None
+        )
         
         st.download_button(
             label="💾 Download Analytics JSON",
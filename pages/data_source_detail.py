@@ -1,10 +1,116 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+# Data source fields (as flattened by json_normalize) mapped to table column and default value
+SOURCE_COLUMNS = {
+    'officialname': ('Name', 'Unknown'),
+    'englishname': ('English Name', ''),
+    'datasourcetype.classname': ('Type', 'Unknown'),
+    'contenttypes': ('Content Types', 'Not specified'),
+    'subjects': ('Subjects', 'Not specified'),
+    'websiteurl': ('Website', ''),
+    'status': ('Status', 'Unknown'),
+    'validated': ('Validated', 'Unknown'),
+    'collectionmode': ('Collection Mode', 'Unknown'),
+    'master': ('Master', 'Unknown')
+}
+
+def join_classnames(items, limit=None):
+    """Join the classname of each item in a list of classified values"""
+    if not isinstance(items, list) or not items:
+        return 'Not specified'
+    return ', '.join(item.get('classname', '') for item in items[:limit])
+
+def build_sources_table(sources_list):
+    """Build the data sources table and the flat list of content types from API results"""
+    sources_df = pd.json_normalize(sources_list).reindex(columns=list(SOURCE_COLUMNS))
+    
+    # One row per (source, content type), taken from the raw lists before they are joined for display
+    content_types = sources_df['contenttypes'].explode().dropna().astype(object).str.get('classname').dropna()
+    
+    sources_df['contenttypes'] = sources_df['contenttypes'].map(join_classnames)
+    sources_df['subjects'] = sources_df['subjects'].map(lambda subjects: join_classnames(subjects, 3))  # Show first 3 subjects
+    
+    sources_df = sources_df.fillna({field: default for field, (_, default) in SOURCE_COLUMNS.items()})
+    sources_df = sources_df.rename(columns={field: column for field, (column, _) in SOURCE_COLUMNS.items()})
+    sources_df.insert(0, 'ID', range(1, len(sources_df) + 1))
+    
+    # Arrow-backed columns: the cached table is handed to st.dataframe without a numpy->Arrow conversion
+    return sources_df.convert_dtypes(dtype_backend='pyarrow'), content_types
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_sources_table(_api_client, org_id):
+    """Get the data sources table and content types for an organization, cached per org_id
+    
+    Raises LookupError when the data sources could not be retrieved, so failures are not cached.
+    """
+    data_sources = _api_client.get_data_sources(org_id)
+    if not data_sources or 'results' not in data_sources:
+        raise LookupError(f"No data sources response for {org_id}")
+    return build_sources_table(data_sources['results'])
+
+# Figures are built once per organization (and data version) and reused across reruns
+@st.cache_data(ttl=600, show_spinner=False)
+def make_sources_figures(_api_client, org_id):
+    """Build the source type, validation and content type charts for an organization"""
+    sources_df, content_types = get_sources_table(_api_client, org_id)
+    
+    type_counts = sources_df['Type'].value_counts()
+    fig_types = go.Figure(go.Pie(values=type_counts.values, labels=type_counts.index))
+    fig_types.update_layout(title="Distribution of Data Source Types")
+    
+    validation_counts = sources_df['Validated'].value_counts()
+    colors = {'true': '#28a745', 'false': '#dc3545', 'Unknown': '#6c757d'}
+    fig_validation = go.Figure(go.Pie(
+        values=validation_counts.values,
+        labels=validation_counts.index,
+        marker=dict(colors=[colors.get(validated) for validated in validation_counts.index])
+    ))
+    fig_validation.update_layout(title="Validation Status Distribution")
+    
+    fig_content = None
+    if not content_types.empty:
+        content_type_counts = content_types.value_counts()
+        
+        fig_content = go.Figure(go.Bar(
+            x=content_type_counts.values,
+            y=content_type_counts.index,
+            orientation='h'
+        ))
+        fig_content.update_layout(
+            title="Content Types Distribution",
+            xaxis_title="Number of Sources",
+            yaxis_title="Content Type",
+            height=400
+        )
+    
+    return fig_types, fig_validation, fig_content
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_trend_figure(_data_manager, org_id, data_version):
+    """Build the data sources count chart of the last 30 days for an organization (None without history)"""
+    # Only this organization's rows and the charted columns are read
+    org_historical = _data_manager.get_historical_data(30, columns=['date', 'data_sources_count'], org_id=org_id)
+    if org_historical.empty or 'data_sources_count' not in org_historical:
+        return None
+    
+    # Data sources count over time (history is already date-ordered with datetime dates)
+    fig_trend = go.Figure(go.Scatter(
+        x=org_historical['date'],
+        y=org_historical['data_sources_count'],
+        mode='lines+markers'
+    ))
+    fig_trend.update_layout(
+        title="Data Sources Count Over Time",
+        xaxis_title="Date",
+        yaxis_title="Number of Data Sources"
+    )
+    return fig_trend
+
 def show_page(data_manager, api_client):
     """Show detailed data source information"""
     
@@ -24,21 +130,23 @@ def show_page(data_manager, api_client):
         st.info("No organizations with data sources found.")
         return
     
-    # Organization selector
-    org_options = {}
-    for idx, org in orgs_with_sources.iterrows():
-        display_name = f"{org['acronym']} - {org['organization_name']}"
-        org_options[display_name] = org
+    # Organization selector (options are row positions, labels zipped from the name columns)
+    orgs_with_sources = orgs_with_sources.reset_index(drop=True)
+    org_labels = [
+        f"{acronym} - {name}"
+        for acronym, name in zip(orgs_with_sources['acronym'].tolist(), orgs_with_sources['organization_name'].tolist())
+    ]
     
-    selected_org_name = st.selectbox(
+    selected_index = st.selectbox(
         "Select Organization",
-        options=list(org_options.keys())
+        options=range(len(org_labels)),
+        format_func=lambda i: org_labels[i]
     )
     
-    if not selected_org_name:
+    if selected_index is None:
         return
     
-    selected_org = org_options[selected_org_name]
+    selected_org = orgs_with_sources.iloc[selected_index]
     org_id = selected_org['org_id']
     
     # Display organization info
@@ -66,40 +174,15 @@ def show_page(data_manager, api_client):
     st.subheader("💾 Data Sources Overview")
     
     with st.spinner("Loading data sources..."):
-        data_sources = api_client.get_data_sources(org_id)
+        # Data sources table, built once per organization and cached
+        try:
+            sources_df, content_types = get_sources_table(api_client, org_id)
+        except LookupError:
+            sources_df = None
         
-        if data_sources and 'results' in data_sources:
-            sources_list = data_sources['results']
-            
-            if sources_list:
-                # Create comprehensive data sources table
-                sources_data = []
-                for i, source in enumerate(sources_list):
-                    # Extract content types
-                    content_types = []
-                    for ct in source.get('contenttypes', []):
-                        content_types.append(ct.get('classname', ''))
-                    
-                    # Extract subjects
-                    subjects = []
-                    for subj in source.get('subjects', []):
-                        subjects.append(subj.get('classname', ''))
-                    
-                    sources_data.append({
-                        'ID': i + 1,
-                        'Name': source.get('officialname', 'Unknown'),
-                        'English Name': source.get('englishname', ''),
-                        'Type': source.get('datasourcetype', {}).get('classname', 'Unknown'),
-                        'Content Types': ', '.join(content_types) if content_types else 'Not specified',
-                        'Subjects': ', '.join(subjects[:3]) if subjects else 'Not specified',  # Show first 3 subjects
-                        'Website': source.get('websiteurl', ''),
-                        'Status': source.get('status', 'Unknown'),
-                        'Validated': source.get('validated', 'Unknown'),
-                        'Collection Mode': source.get('collectionmode', 'Unknown'),
-                        'Master': source.get('master', 'Unknown')
-                    })
-                
-                sources_df = pd.DataFrame(sources_data)
+        if sources_df is not None:
+            if not sources_df.empty:
+                fig_types, fig_validation, fig_content = make_sources_figures(api_client, org_id)
                 
                 # Display summary metrics
                 col1, col2, col3, col4 = st.columns(4)
@@ -124,25 +207,10 @@ def show_page(data_manager, api_client):
                 
                 with col1:
                     st.subheader("📊 Data Source Types")
-                    type_counts = sources_df['Type'].value_counts()
-                    fig_types = px.pie(
-                        values=type_counts.values,
-                        names=type_counts.index,
-                        title="Distribution of Data Source Types"
-                    )
                     st.plotly_chart(fig_types, use_container_width=True)
                 
                 with col2:
                     st.subheader("✅ Validation Status")
-                    validation_counts = sources_df['Validated'].value_counts()
-                    colors = {'true': '#28a745', 'false': '#dc3545', 'Unknown': '#6c757d'}
-                    fig_validation = px.pie(
-                        values=validation_counts.values,
-                        names=validation_counts.index,
-                        title="Validation Status Distribution",
-                        color=validation_counts.index,
-                        color_discrete_map=colors
-                    )
                     st.plotly_chart(fig_validation, use_container_width=True)
                 
                 # Detailed data sources table
@@ -169,17 +237,19 @@ def show_page(data_manager, api_client):
                         options=['All', 'true', 'false', 'Unknown']
                     )
                 
-                # Apply filters
-                filtered_sources = sources_df.copy()
+                # Apply filters as one combined mask and a single gather
+                mask = np.ones(len(sources_df), dtype=bool)
                 
                 if type_filter != 'All':
-                    filtered_sources = filtered_sources[filtered_sources['Type'] == type_filter]
+                    mask &= sources_df['Type'].to_numpy() == type_filter
                 
                 if status_filter != 'All':
-                    filtered_sources = filtered_sources[filtered_sources['Status'] == status_filter]
+                    mask &= sources_df['Status'].to_numpy() == status_filter
                 
                 if validated_filter != 'All':
-                    filtered_sources = filtered_sources[filtered_sources['Validated'] == validated_filter]
+                    mask &= sources_df['Validated'].to_numpy() == validated_filter
+                
+                filtered_sources = sources_df[mask]
                 
                 # Display filtered table
                 st.dataframe(
@@ -194,47 +264,17 @@ def show_page(data_manager, api_client):
                 # Content types analysis
                 st.subheader("📑 Content Types Analysis")
                 
-                # Extract all content types
-                all_content_types = []
-                for content_types_str in sources_df['Content Types'].dropna():
-                    if content_types_str != 'Not specified':
-                        types_list = [ct.strip() for ct in content_types_str.split(',')]
-                        all_content_types.extend(types_list)
-                
-                if all_content_types:
-                    content_type_counts = pd.Series(all_content_types).value_counts()
-                    
-                    fig_content = px.bar(
-                        x=content_type_counts.values,
-                        y=content_type_counts.index,
-                        orientation='h',
-                        title="Content Types Distribution",
-                        labels={'x': 'Number of Sources', 'y': 'Content Type'}
-                    )
-                    fig_content.update_layout(height=400)
+                if fig_content is not None:
                     st.plotly_chart(fig_content, use_container_width=True)
                 
                 # Historical data source trends
                 st.subheader("📈 Data Source Trends")
                 
-                historical_data = data_manager.get_historical_data(30)
-                if not historical_data.empty:
-                    org_historical = historical_data[historical_data['org_id'] == org_id]
-                    
-                    if not org_historical.empty:
-                        org_historical = org_historical.sort_values('date')
-                        org_historical['date'] = pd.to_datetime(org_historical['date'])
-                        
-                        # Data sources count over time
-                        fig_trend = px.line(
-                            org_historical,
-                            x='date',
-                            y='data_sources_count',
-                            title="Data Sources Count Over Time",
-                            labels={'data_sources_count': 'Number of Data Sources'},
-                            markers=True
-                        )
-                        st.plotly_chart(fig_trend, use_container_width=True)
+                # Cached until the day changes or new data is collected
+                data_version = (datetime.now().date(), data_manager.get_last_update_time())
+                fig_trend = make_trend_figure(data_manager, org_id, data_version)
+                if fig_trend is not None:
+                    st.plotly_chart(fig_trend, use_container_width=True)
                 
                 # Export data sources information
                 if st.button("📥 Export Data Sources Information"):
@@ -254,7 +294,7 @@ def show_page(data_manager, api_client):
     # System health indicators for data sources
     st.subheader("🏥 Data Source Health Indicators")
     
-    if 'sources_df' in locals() and not sources_df.empty:
+    if sources_df is not None and not sources_df.empty:
         col1, col2, col3 = st.columns(3)
         
         with col1:
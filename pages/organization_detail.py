@@ -1,9 +1,261 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Line traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Maximum number of organizations offered in the selector at once
+MAX_ORG_OPTIONS = 50
+
+# Data source fields (as flattened by json_normalize) mapped to table column and default value
+SOURCE_COLUMNS = {
+    'officialname': ('Name', 'Unknown'),
+    'datasourcetype.classname': ('Type', 'Unknown'),
+    'contenttypes': ('Content Types', ''),
+    'websiteurl': ('URL', ''),
+    'status': ('Status', 'Unknown')
+}
+
+# Publication fields (as flattened by json_normalize) shown in the recent publications table
+PUBLICATION_FIELDS = ['title.value', 'resulttype.classname', 'dateofacceptance.value', 'dateofcollection']
+
+# API lookups are cached per ROR link / org_id so widget reruns do not hit the OpenAIRE API again.
+# They raise LookupError when the API returns nothing, so failures are not cached.
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_organization_id(_api_client, ror_link):
+    """Get the OpenAIRE organization ID for a ROR link"""
+    org_id = _api_client.get_organization_id(ror_link)
+    if not org_id:
+        raise LookupError(f"No OpenAIRE organization ID for {ror_link}")
+    return org_id
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_stats(_api_client, org_id, _publications=None, _data_sources=None):
+    """Get the current statistics of an organization, computed from its already fetched responses"""
+    current_stats = _api_client.get_organization_stats(org_id, _publications, _data_sources)
+    if not current_stats:
+        raise LookupError(f"No statistics for {org_id}")
+    return current_stats
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_data_sources(_api_client, org_id):
+    """Get the data sources response of an organization"""
+    data_sources = _api_client.get_data_sources(org_id)
+    if not data_sources:
+        raise LookupError(f"No data sources response for {org_id}")
+    return data_sources
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_publications(_api_client, org_id):
+    """Get the publications response of an organization"""
+    publications = _api_client.get_organization_publications(org_id)
+    if not publications:
+        raise LookupError(f"No publications response for {org_id}")
+    return publications
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_organization_history(_data_manager, org_id, days, data_version):
+    """Load an organization's historical data for the last N days (data_version keys the cache)"""
+    return _data_manager.get_historical_data(days, org_id=org_id)
+
+# Figures are cached on their (small) input frames, so reruns with unchanged data reuse them
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_history_figures(org_historical, org_id):
+    """Build the publications, data freshness and repository health charts of an organization's history"""
+    scatter_trace = go.Scattergl if len(org_historical) > WEBGL_MIN_POINTS else go.Scatter
+    
+    # Publications trend
+    fig_pubs = go.Figure()
+    
+    fig_pubs.add_trace(scatter_trace(
+        x=org_historical['date'],
+        y=org_historical['publications_total'],
+        mode='lines+markers',
+        name='Total Publications',
+        line=dict(color='#1f77b4', width=3)
+    ))
+    
+    fig_pubs.add_trace(scatter_trace(
+        x=org_historical['date'],
+        y=org_historical['publications_recent'],
+        mode='lines+markers',
+        name='Recent Publications',
+        line=dict(color='#ff7f0e', width=2)
+    ))
+    
+    fig_pubs.update_layout(
+        title="Publications Over Time",
+        xaxis_title="Date",
+        yaxis_title="Number of Publications",
+        hovermode='x unified',
+        uirevision=org_id  # Keep pan/zoom across reruns for the same organization
+    )
+    
+    # Data freshness trend
+    fig_fresh = go.Figure(scatter_trace(
+        x=org_historical['date'],
+        y=org_historical['data_freshness_days'],
+        mode='lines',
+        line=dict(color='#17becf')
+    ))
+    fig_fresh.update_layout(
+        title="Data Freshness Over Time",
+        xaxis_title="Date",
+        yaxis_title="Days Since Last Publication",
+        uirevision=org_id
+    )
+    
+    # Add threshold lines
+    fig_fresh.add_hline(y=7, line_dash="dash", line_color="green", 
+                      annotation_text="Healthy threshold")
+    fig_fresh.add_hline(y=30, line_dash="dash", line_color="orange", 
+                      annotation_text="Warning threshold")
+    
+    # Repository health over time
+    health_mapping = {'healthy': 3, 'warning': 2, 'critical': 1, 'unknown': 0}
+    health_colors = {'healthy': '#28a745', 'warning': '#ffc107', 'critical': '#dc3545', 'unknown': '#6c757d'}
+    
+    # Binned by week: one marker per week with its most frequent status (the worst one on ties)
+    weekly_health = (
+        org_historical.groupby([pd.Grouper(key='date', freq='W'), 'repository_health'])
+        .size()
+        .reset_index(name='days')
+    )
+    weekly_health['rank'] = weekly_health['repository_health'].map(health_mapping)
+    weekly_health = weekly_health.sort_values(['date', 'days', 'rank'], ascending=[True, False, True]).drop_duplicates('date')
+    
+    # One marker trace per health status, as a legend entry each
+    fig_health = go.Figure()
+    for health, health_rows in weekly_health.groupby('repository_health', sort=False):
+        fig_health.add_trace(go.Scatter(
+            x=health_rows['date'],
+            y=health_rows['repository_health'].map(health_mapping),
+            mode='markers',
+            name=health,
+            marker=dict(color=health_colors.get(health))
+        ))
+    
+    fig_health.update_layout(
+        title="Repository Health Status Over Time (Weekly)",
+        xaxis_title="Week Ending",
+        legend_title_text="Repository Health",
+        yaxis=dict(
+            title="Health Status",
+            tickmode='array',
+            tickvals=[0, 1, 2, 3],
+            ticktext=['Unknown', 'Critical', 'Warning', 'Healthy']
+        )
+    )
+    
+    return fig_pubs, fig_fresh, fig_health
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def make_source_types_figure(type_counts):
+    """Build the data source types pie chart"""
+    fig_types = go.Figure(go.Pie(values=type_counts.values, labels=type_counts.index))
+    fig_types.update_layout(title="Data Source Types Distribution")
+    return fig_types
+
+def select_fields(records, fields):
+    """Frame of the given (possibly "parent.child") fields of API result records, built column by column
+    
+    Equivalent to json_normalize followed by reindex, but only the requested fields are extracted.
+    """
+    columns = {}
+    for field in fields:
+        key, _, subkey = field.partition('.')
+        values = [record.get(key) for record in records]
+        if subkey:
+            values = [value.get(subkey) if isinstance(value, dict) else None for value in values]
+        columns[field] = values
+    return pd.DataFrame(columns, columns=fields)
+
+def build_sources_table(sources_list):
+    """Build the data sources table from API results"""
+    sources_df = select_fields(sources_list, list(SOURCE_COLUMNS))
+    sources_df['contenttypes'] = sources_df['contenttypes'].map(
+        lambda items: ', '.join(item.get('classname', '') for item in items) if isinstance(items, list) else ''
+    )
+    sources_df = sources_df.fillna({field: default for field, (_, default) in SOURCE_COLUMNS.items()})
+    return sources_df.rename(columns={field: column for field, (column, _) in SOURCE_COLUMNS.items()})
+
+def date_part(values):
+    """Date part (first 10 characters) of timestamp strings, 'Unknown' where missing or empty"""
+    dates = values.astype(object).str.slice(0, 10)
+    return dates.where(dates.notna() & (dates != ''), 'Unknown')
+
+def build_publications_table(pubs_list):
+    """Build the recent publications table from API results"""
+    pubs = select_fields(pubs_list, PUBLICATION_FIELDS)
+    
+    # Truncate long titles to 100 characters
+    titles = pubs['title.value'].astype(object)
+    long_titles = titles.str.len() > 100
+    titles = titles.where(~long_titles, titles.str.slice(0, 100) + '...')
+    
+    return pd.DataFrame({
+        'Title': titles.fillna('No title'),
+        'Type': pubs['resulttype.classname'].fillna('Unknown'),
+        'Publication Date': date_part(pubs['dateofacceptance.value']),
+        'Collection Date': date_part(pubs['dateofcollection'])
+    })
+
+@st.cache_resource
+def get_api_executor():
+    """Get the executor used to fetch an organization's API data concurrently"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="org-api")
+
+def future_result(future):
+    """Get the result of a cached API lookup future, or None when the lookup failed"""
+    try:
+        return future.result()
+    except LookupError:
+        return None
+
+def clear_api_caches():
+    """Drop the cached API responses so the next run fetches fresh data"""
+    for cached_function in (get_cached_organization_id, get_cached_stats, get_cached_data_sources, get_cached_publications):
+        cached_function.clear()
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def build_export_json(selected_org, current_stats, org_historical):
+    """Serialize the organization export, with orjson when available (cached on the exported data)"""
+    export_data = {
+        'organization_info': selected_org.to_dict(),
+        'current_stats': current_stats if current_stats else {},
+        'historical_data': org_historical.to_dict('records') if not org_historical.empty else []
+    }
+    
+    if orjson is not None:
+        return orjson.dumps(
+            export_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=str
+        )
+    return json.dumps(export_data, indent=2, default=str)
+
+@st.fragment
+def render_export(selected_org, current_stats, org_historical):
+    """Render the organization export (the button only reruns this fragment)"""
+    if st.button("📥 Export Organization Data"):
+        json_str = build_export_json(selected_org, current_stats, org_historical)
+        
+        st.download_button(
+            label="💾 Download JSON",
+            data=json_str,
+            file_name=f"{selected_org['acronym_EN']}_data_{datetime.now().strftime('%Y%m%d')}.json",
+            mime="application/json"
+        )
 
 def show_page(data_manager, api_client):
     """Show detailed organization information"""
@@ -15,30 +267,57 @@ def show_page(data_manager, api_client):
         st.error("No organizations data available")
         return
     
-    # Organization selector
-    org_options = {}
-    for idx, org in data_manager.organizations_df.iterrows():
-        display_name = f"{org['acronym_EN']} - {org['full_name_in_English']}"
-        org_options[display_name] = org
+    # Organization selector (options are row positions, labels zipped from the name columns)
+    organizations_df = data_manager.organizations_df
+    org_labels = [
+        f"{acronym} - {name}"
+        for acronym, name in zip(organizations_df['acronym_EN'].tolist(), organizations_df['full_name_in_English'].tolist())
+    ]
+    
+    # Search narrows the selector to the first MAX_ORG_OPTIONS matching organizations
+    search_query = st.text_input("Search Organization", placeholder="Type part of a name or acronym")
+    search_query = search_query.strip().lower()
+    matching_indices = [i for i, label in enumerate(org_labels) if search_query in label.lower()]
+    
+    if not matching_indices:
+        st.info("No organizations match the search.")
+        return
+    
+    if len(matching_indices) > MAX_ORG_OPTIONS:
+        st.caption(f"Showing {MAX_ORG_OPTIONS} of {len(matching_indices)} organizations - refine the search to narrow the list")
+        matching_indices = matching_indices[:MAX_ORG_OPTIONS]
     
-    selected_org_name = st.selectbox(
+    selected_index = st.selectbox(
         "Select Organization",
-        options=list(org_options.keys())
+        options=matching_indices,
+        format_func=lambda i: org_labels[i]
     )
     
-    if not selected_org_name:
+    if selected_index is None:
         return
     
-    selected_org = org_options[selected_org_name]
+    selected_org = organizations_df.iloc[selected_index]
+    
+    if st.button("🔄 Refresh from OpenAIRE"):
+        clear_api_caches()
     
     # Get organization data
     ror_link = selected_org['ROR_LINK']
-    org_id = api_client.get_organization_id(ror_link)
+    try:
+        org_id = get_cached_organization_id(api_client, ror_link)
+    except LookupError:
+        org_id = None
     
     if not org_id:
         st.error("Could not retrieve OpenAIRE organization ID")
         return
     
+    # Start the data sources and publications requests concurrently (each cached per org_id);
+    # the current stats are computed from the same two responses rather than requested again
+    executor = get_api_executor()
+    data_sources_future = executor.submit(get_cached_data_sources, api_client, org_id)
+    publications_future = executor.submit(get_cached_publications, api_client, org_id)
+    
     # Display organization info
     col1, col2 = st.columns([2, 1])
     
@@ -52,7 +331,12 @@ def show_page(data_manager, api_client):
     with col2:
         # Get current stats
         with st.spinner("Loading current statistics..."):
-            current_stats = api_client.get_organization_stats(org_id)
+            try:
+                current_stats = get_cached_stats(
+                    api_client, org_id, future_result(publications_future), future_result(data_sources_future)
+                )
+            except LookupError:
+                current_stats = None
             
             if current_stats:
                 # Status indicator
@@ -79,130 +363,49 @@ def show_page(data_manager, api_client):
     st.subheader("📈 Historical Trends")
     
     # Get historical data for this organization
-    historical_data = data_manager.get_historical_data(90)  # Last 90 days
+    # Cached until the day changes or new data is collected
+    data_version = (datetime.now().date(), data_manager.get_last_update_time())
+    org_historical = load_organization_history(data_manager, org_id, 90, data_version)  # Last 90 days
     
-    if not historical_data.empty:
-        org_historical = historical_data[historical_data['org_id'] == org_id]
+    if not org_historical.empty:
+        # Create trend charts (figures are cached on the organization's history)
+        fig_pubs, fig_fresh, fig_health = make_history_figures(org_historical, org_id)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.plotly_chart(fig_pubs, use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(fig_fresh, use_container_width=True)
+        
+        # Repository health over time
+        st.subheader("🏥 Repository Health Over Time")
+        
+        st.plotly_chart(fig_health, use_container_width=True)
         
-        if not org_historical.empty:
-            # Sort by date
-            org_historical = org_historical.sort_values('date')
-            org_historical['date'] = pd.to_datetime(org_historical['date'])
-            
-            # Create trend charts
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Publications trend
-                fig_pubs = go.Figure()
-                
-                fig_pubs.add_trace(go.Scatter(
-                    x=org_historical['date'],
-                    y=org_historical['publications_total'],
-                    mode='lines+markers',
-                    name='Total Publications',
-                    line=dict(color='#1f77b4', width=3)
-                ))
-                
-                fig_pubs.add_trace(go.Scatter(
-                    x=org_historical['date'],
-                    y=org_historical['publications_recent'],
-                    mode='lines+markers',
-                    name='Recent Publications',
-                    line=dict(color='#ff7f0e', width=2)
-                ))
-                
-                fig_pubs.update_layout(
-                    title="Publications Over Time",
-                    xaxis_title="Date",
-                    yaxis_title="Number of Publications",
-                    hovermode='x unified'
-                )
-                
-                st.plotly_chart(fig_pubs, use_container_width=True)
-            
-            with col2:
-                # Data freshness trend
-                fig_fresh = px.line(
-                    org_historical,
-                    x='date',
-                    y='data_freshness_days',
-                    title="Data Freshness Over Time",
-                    labels={'data_freshness_days': 'Days Since Last Publication'},
-                    color_discrete_sequence=['#17becf']
-                )
-                
-                # Add threshold lines
-                fig_fresh.add_hline(y=7, line_dash="dash", line_color="green", 
-                                  annotation_text="Healthy threshold")
-                fig_fresh.add_hline(y=30, line_dash="dash", line_color="orange", 
-                                  annotation_text="Warning threshold")
-                
-                st.plotly_chart(fig_fresh, use_container_width=True)
-            
-            # Repository health over time
-            st.subheader("🏥 Repository Health Over Time")
-            
-            health_mapping = {'healthy': 3, 'warning': 2, 'critical': 1, 'unknown': 0}
-            org_historical['health_numeric'] = org_historical['repository_health'].map(health_mapping)
-            
-            fig_health = px.scatter(
-                org_historical,
-                x='date',
-                y='health_numeric',
-                color='repository_health',
-                color_discrete_map={'healthy': '#28a745', 'warning': '#ffc107', 'critical': '#dc3545', 'unknown': '#6c757d'},
-                title="Repository Health Status Over Time",
-                labels={'health_numeric': 'Health Status'}
-            )
-            
-            fig_health.update_layout(
-                yaxis=dict(
-                    tickmode='array',
-                    tickvals=[0, 1, 2, 3],
-                    ticktext=['Unknown', 'Critical', 'Warning', 'Healthy']
-                )
-            )
-            
-            st.plotly_chart(fig_health, use_container_width=True)
-            
-        else:
-            st.info("No historical data available for this organization")
     else:
-        st.info("No historical data available")
+        st.info("No historical data available for this organization")
     
     # Data sources section
     st.subheader("💾 Data Sources")
     
     with st.spinner("Loading data sources..."):
-        data_sources = api_client.get_data_sources(org_id)
+        try:
+            data_sources = data_sources_future.result()
+        except LookupError:
+            data_sources = None
         
         if data_sources and 'results' in data_sources:
             sources_list = data_sources['results']
             
             if sources_list:
                 # Create data sources dataframe
-                sources_data = []
-                for source in sources_list:
-                    sources_data.append({
-                        'Name': source.get('officialname', 'Unknown'),
-                        'Type': source.get('datasourcetype', {}).get('classname', 'Unknown'),
-                        'Content Types': ', '.join([ct.get('classname', '') for ct in source.get('contenttypes', [])]),
-                        'URL': source.get('websiteurl', ''),
-                        'Status': source.get('status', 'Unknown')
-                    })
-                
-                sources_df = pd.DataFrame(sources_data)
+                sources_df = build_sources_table(sources_list)
                 st.dataframe(sources_df, use_container_width=True, hide_index=True)
                 
                 # Data source types chart
                 if not sources_df.empty:
-                    type_counts = sources_df['Type'].value_counts()
-                    fig_types = px.pie(
-                        values=type_counts.values,
-                        names=type_counts.index,
-                        title="Data Source Types Distribution"
-                    )
+                    fig_types = make_source_types_figure(sources_df['Type'].value_counts())
                     st.plotly_chart(fig_types, use_container_width=True)
             else:
                 st.info("No data sources found for this organization")
@@ -213,22 +416,16 @@ def show_page(data_manager, api_client):
     st.subheader("📚 Recent Publications")
     
     with st.spinner("Loading recent publications..."):
-        publications = api_client.get_organization_publications(org_id)
+        try:
+            publications = publications_future.result()
+        except LookupError:
+            publications = None
         
         if publications and 'results' in publications:
             pubs_list = publications['results'][:10]  # Show first 10
             
             if pubs_list:
-                pubs_data = []
-                for pub in pubs_list:
-                    pubs_data.append({
-                        'Title': pub.get('title', {}).get('value', 'No title')[:100] + '...' if len(pub.get('title', {}).get('value', '')) > 100 else pub.get('title', {}).get('value', 'No title'),
-                        'Type': pub.get('resulttype', {}).get('classname', 'Unknown'),
-                        'Publication Date': pub.get('dateofacceptance', {}).get('value', 'Unknown')[:10] if pub.get('dateofacceptance', {}).get('value') else 'Unknown',
-                        'Collection Date': pub.get('dateofcollection', 'Unknown')[:10] if pub.get('dateofcollection') else 'Unknown'
-                    })
-                
-                pubs_df = pd.DataFrame(pubs_data)
+                pubs_df = build_publications_table(pubs_list)
                 st.dataframe(pubs_df, use_container_width=True, hide_index=True)
             else:
                 st.info("No recent publications found")
@@ -236,19 +433,4 @@ def show_page(data_manager, api_client):
             st.warning("Could not retrieve publications information")
     
     # Export organization data
-    if st.button("📥 Export Organization Data"):
-        export_data = {
-            'organization_info': selected_org.to_dict(),
-            'current_stats': current_stats if current_stats else {},
-            'historical_data': org_historical.to_dict('records') if not org_historical.empty else []
-        }
-        
-        import json
-        json_str = json.dumps(export_data, indent=2, default=str)
-        
-        st.download_button(
-            label="💾 Download JSON",
-            data=json_str,
-            file_name=f"{selected_org['acronym_EN']}_data_{datetime.now().strftime('%Y%m%d')}.json",
-            mime="application/json"
-        )
+    render_export(selected_org, current_stats, org_historical)
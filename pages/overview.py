@@ -1,11 +1,144 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
 
+# Line traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Status indicator per repository health (any other value shows as unknown)
+STATUS_EMOJI = {
+    'healthy': "🟢",
+    'warning': "🟡",
+    'critical': "🔴"
+}
+
+# Columns of the current data used for the summary metrics and charts
+SUMMARY_COLUMNS = [
+    'main_grouping', 'repository_health',
+    'publications_total', 'publications_recent', 'data_sources_count'
+]
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_historical_data(_data_manager, days, data_version):
+    """Load historical data for the last N days (data_version keys the cache)"""
+    return _data_manager.get_historical_data(days)
+
+# Figures are cached on their (small) input frames, so reruns with unchanged data reuse them
+@st.cache_data(ttl=600, show_spinner=False)
+def make_health_figure(health_counts):
+    """Build the repository health distribution pie chart"""
+    colors = {'healthy': '#28a745', 'warning': '#ffc107', 'critical': '#dc3545', 'unknown': '#6c757d'}
+    
+    fig_health = go.Figure(go.Pie(
+        values=health_counts.values,
+        labels=health_counts.index,
+        marker=dict(colors=[colors.get(health) for health in health_counts.index]),
+        textposition='inside',
+        textinfo='percent+label'
+    ))
+    fig_health.update_layout(title="Repository Health Distribution")
+    return fig_health
+
+@st.cache_data(ttl=600, show_spinner=False)
+def make_groups_figure(group_pubs):
+    """Build the publications per organization group bar chart"""
+    fig_groups = go.Figure(go.Bar(
+        x=group_pubs.values,
+        y=group_pubs.index,
+        orientation='h',
+        marker=dict(color=group_pubs.values, colorscale='Blues', showscale=True)
+    ))
+    fig_groups.update_layout(title="Total Publications by Group", showlegend=False)
+    return fig_groups
+
+@st.cache_data(ttl=600, show_spinner=False)
+def make_trends_figure(daily_trends):
+    """Build the daily publication totals chart"""
+    fig_trends = go.Figure()
+    scatter_trace = go.Scattergl if len(daily_trends) > WEBGL_MIN_POINTS else go.Scatter
+    
+    fig_trends.add_trace(scatter_trace(
+        x=daily_trends['date'],
+        y=daily_trends['publications_total'],
+        mode='lines+markers',
+        name='Total Publications',
+        line=dict(color='#1f77b4', width=3)
+    ))
+    
+    fig_trends.add_trace(scatter_trace(
+        x=daily_trends['date'],
+        y=daily_trends['publications_recent'],
+        mode='lines+markers',
+        name='Recent Publications',
+        line=dict(color='#ff7f0e', width=2),
+        yaxis='y2'
+    ))
+    
+    fig_trends.update_layout(
+        title="Publication Trends Over Time",
+        xaxis_title="Date",
+        yaxis_title="Total Publications",
+        yaxis2=dict(title="Recent Publications", overlaying='y', side='right'),
+        hovermode='x unified',
+        uirevision='overview_trends'  # Keep pan/zoom across reruns
+    )
+    
+    return fig_trends
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=4)
+def build_export_csv(recent_data):
+    """Serialize the current data to CSV (cached on the data)"""
+    return recent_data.to_csv(index=False)
+
+@st.fragment
+def render_organizations_table(display_data):
+    """Render the organizations table filters and table (filter changes only rerun this fragment)"""
+    # Add filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        group_filter = st.selectbox(
+            "Filter by Group",
+            options=['All'] + sorted(display_data['Group'].unique().tolist())
+        )
+    
+    with col2:
+        health_filter = st.selectbox(
+            "Filter by Health",
+            options=['All', 'healthy', 'warning', 'critical', 'unknown']
+        )
+    
+    with col3:
+        min_pubs = st.number_input(
+            "Minimum Publications",
+            min_value=0,
+            value=0,
+            step=1
+        )
+    
+    # Apply filters as one combined mask and a single gather
+    mask = np.ones(len(display_data), dtype=bool)
+    
+    if group_filter != 'All':
+        mask &= display_data['Group'].to_numpy() == group_filter
+    
+    if health_filter != 'All':
+        mask &= display_data['repository_health'].to_numpy() == health_filter
+    
+    if min_pubs > 0:
+        mask &= display_data['Total Pubs'].to_numpy() >= min_pubs
+    
+    filtered_data = display_data[mask]
+    
+    # Display filtered table
+    st.dataframe(
+        filtered_data.drop('repository_health', axis=1),
+        use_container_width=True,
+        hide_index=True
+    )
+
 def show_page(data_manager, alert_system):
     """Show the main dashboard overview page"""
     
@@ -13,7 +146,9 @@ def show_page(data_manager, alert_system):
     
     # Get recent data
     recent_data = data_manager.load_daily_data()
-    historical_data = data_manager.get_historical_data(30)
+    # Cached until the day changes or new data is collected
+    data_version = (datetime.now().date(), data_manager.get_last_update_time())
+    historical_data = load_historical_data(data_manager, 30, data_version)
     
     if recent_data.empty:
         st.warning("No data available. Please run data collection first.")
@@ -24,11 +159,16 @@ def show_page(data_manager, alert_system):
     alert_summary = alert_system.get_alert_summary()
     
     # Display alert banner if there are critical alerts
-    critical_alerts = [a for a in alerts if a['severity'] == 'critical']
+    critical_alerts = [a for a in alerts if a.severity == 'critical']
     if critical_alerts:
         st.error(f"🚨 **{len(critical_alerts)} Critical Alert(s)** - Immediate attention required!")
         for alert in critical_alerts[:3]:  # Show top 3
-            st.error(f"**{alert['organization']}**: {alert['message']}")
+            st.error(f"**{alert.organization}**: {alert.message}")
+    
+    # Aggregates for the metrics and charts, computed once on just the columns they need
+    summary_data = recent_data[SUMMARY_COLUMNS].astype({'main_grouping': 'category', 'repository_health': 'category'})
+    publication_totals = summary_data[['publications_total', 'publications_recent']].sum()
+    health_counts = summary_data['repository_health'].value_counts()
     
     # Key metrics row
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -38,15 +178,15 @@ def show_page(data_manager, alert_system):
         st.metric("Total Organizations", total_orgs)
     
     with col2:
-        total_publications = recent_data['publications_total'].sum()
+        total_publications = publication_totals['publications_total']
         st.metric("Total Publications", f"{total_publications:,}")
     
     with col3:
-        recent_publications = recent_data['publications_recent'].sum()
+        recent_publications = publication_totals['publications_recent']
         st.metric("Recent Publications", recent_publications)
     
     with col4:
-        healthy_orgs = len(recent_data[recent_data['repository_health'] == 'healthy'])
+        healthy_orgs = health_counts.get('healthy', 0)
         st.metric("Healthy Repositories", healthy_orgs)
     
     with col5:
@@ -60,34 +200,16 @@ def show_page(data_manager, alert_system):
         st.subheader("Repository Health Status")
         
         # Health status distribution
-        health_counts = recent_data['repository_health'].value_counts()
-        colors = {'healthy': '#28a745', 'warning': '#ffc107', 'critical': '#dc3545', 'unknown': '#6c757d'}
-        
-        fig_health = px.pie(
-            values=health_counts.values,
-            names=health_counts.index,
-            color=health_counts.index,
-            color_discrete_map=colors,
-            title="Repository Health Distribution"
-        )
-        fig_health.update_traces(textposition='inside', textinfo='percent+label')
+        fig_health = make_health_figure(health_counts)
         st.plotly_chart(fig_health, use_container_width=True)
     
     with col2:
         st.subheader("Publications by Organization Group")
         
         # Group publications by main grouping
-        group_pubs = recent_data.groupby('main_grouping')['publications_total'].sum().sort_values(ascending=True)
+        group_pubs = summary_data.groupby('main_grouping', observed=True)['publications_total'].sum().sort_values(ascending=True)
         
-        fig_groups = px.bar(
-            x=group_pubs.values,
-            y=group_pubs.index,
-            orientation='h',
-            title="Total Publications by Group",
-            color=group_pubs.values,
-            color_continuous_scale='Blues'
-        )
-        fig_groups.update_layout(showlegend=False)
+        fig_groups = make_groups_figure(group_pubs)
         st.plotly_chart(fig_groups, use_container_width=True)
     
     # Historical trends
@@ -101,37 +223,8 @@ def show_page(data_manager, alert_system):
             'data_sources_count': 'sum'
         }).reset_index()
         
-        daily_trends['date'] = pd.to_datetime(daily_trends['date'])
-        daily_trends = daily_trends.sort_values('date')
-        
         # Create trend chart
-        fig_trends = go.Figure()
-        
-        fig_trends.add_trace(go.Scatter(
-            x=daily_trends['date'],
-            y=daily_trends['publications_total'],
-            mode='lines+markers',
-            name='Total Publications',
-            line=dict(color='#1f77b4', width=3)
-        ))
-        
-        fig_trends.add_trace(go.Scatter(
-            x=daily_trends['date'],
-            y=daily_trends['publications_recent'],
-            mode='lines+markers',
-            name='Recent Publications',
-            line=dict(color='#ff7f0e', width=2),
-            yaxis='y2'
-        ))
-        
-        fig_trends.update_layout(
-            title="Publication Trends Over Time",
-            xaxis_title="Date",
-            yaxis_title="Total Publications",
-            yaxis2=dict(title="Recent Publications", overlaying='y', side='right'),
-            hovermode='x unified'
-        )
-        
+        fig_trends = make_trends_figure(daily_trends)
         st.plotly_chart(fig_trends, use_container_width=True)
     
     # Organizations table
@@ -146,17 +239,7 @@ def show_page(data_manager, alert_system):
     ]].copy()
     
     # Add status indicators
-    def get_status_indicator(health):
-        if health == 'healthy':
-            return "🟢"
-        elif health == 'warning':
-            return "🟡"
-        elif health == 'critical':
-            return "🔴"
-        else:
-            return "⚪"
-    
-    display_data['Status'] = display_data['repository_health'].apply(get_status_indicator)
+    display_data['Status'] = display_data['repository_health'].map(STATUS_EMOJI).fillna("⚪")
     
     # Rename columns for display
     display_data = display_data.rename(columns={
@@ -169,51 +252,11 @@ def show_page(data_manager, alert_system):
         'data_freshness_days': 'Days Since Update'
     })
     
-    # Add filters
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        group_filter = st.selectbox(
-            "Filter by Group",
-            options=['All'] + sorted(display_data['Group'].unique().tolist())
-        )
-    
-    with col2:
-        health_filter = st.selectbox(
-            "Filter by Health",
-            options=['All', 'healthy', 'warning', 'critical', 'unknown']
-        )
-    
-    with col3:
-        min_pubs = st.number_input(
-            "Minimum Publications",
-            min_value=0,
-            value=0,
-            step=1
-        )
-    
-    # Apply filters
-    filtered_data = display_data.copy()
-    
-    if group_filter != 'All':
-        filtered_data = filtered_data[filtered_data['Group'] == group_filter]
-    
-    if health_filter != 'All':
-        filtered_data = filtered_data[filtered_data['repository_health'] == health_filter]
-    
-    if min_pubs > 0:
-        filtered_data = filtered_data[filtered_data['Total Pubs'] >= min_pubs]
-    
-    # Display filtered table
-    st.dataframe(
-        filtered_data.drop('repository_health', axis=1),
-        use_container_width=True,
-        hide_index=True
-    )
+    render_organizations_table(display_data)
     
     # Download data option
     if st.button("📥 Download Current Data"):
-        csv = recent_data.to_csv(index=False)
+        csv = build_export_csv(recent_data)
         st.download_button(
             label="💾 Download CSV",
             data=csv,
@@ -1,7 +1,8 @@
 
 #!/usr/bin/env python3
 """
-Script to setup automated daily data collection via cron
+Script to setup automated daily data collection via cron, or a systemd timer.
+For hosts without crond (e.g. containers) set in_app_collection in config.yaml instead.
 """
 
 import os
@@ -90,8 +91,49 @@ def remove_cron():
         print(f"❌ Error removing cron job: {e}")
         return False
 
+def write_systemd_units():
+    """Write a systemd service and timer unit for daily data collection"""
+    try:
+        project_dir = Path(__file__).parent.absolute()
+        collector_script = project_dir / "data_collector.py"
+        
+        service_file = project_dir / "dutch-research-monitor.service"
+        service_file.write_text(
+            "[Unit]\n"
+            "Description=Dutch Research Monitor daily data collection\n"
+            "\n"
+            "[Service]\n"
+            "Type=oneshot\n"
+            f"WorkingDirectory={project_dir}\n"
+            f"ExecStart={sys.executable} {collector_script}\n"
+        )
+        
+        timer_file = project_dir / "dutch-research-monitor.timer"
+        timer_file.write_text(
+            "[Unit]\n"
+            "Description=Run Dutch Research Monitor data collection daily at 2 AM\n"
+            "\n"
+            "[Timer]\n"
+            "OnCalendar=*-*-* 02:00:00\n"
+            "Persistent=true\n"
+            "\n"
+            "[Install]\n"
+            "WantedBy=timers.target\n"
+        )
+        
+        print("✅ systemd units written!")
+        print(f"Install with: sudo cp {service_file} {timer_file} /etc/systemd/system/")
+        print("Then enable with: sudo systemctl enable --now dutch-research-monitor.timer")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error writing systemd units: {e}")
+        return False
+
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "remove":
         remove_cron()
+    elif len(sys.argv) > 1 and sys.argv[1] == "systemd":
+        write_systemd_units()
     else:
         setup_cron()
@@ -1,9 +1,51 @@
 
 import pandas as pd
+import numpy as np
+import os
+import sys
 import json
+import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
+from collections import Counter
+from dataclasses import dataclass, asdict, replace
 import logging
+import io
+import sqlite3
+import threading
+from contextlib import closing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+def json_default(obj):
+    """Serialize values JSON has no type for: datetimes as ISO strings, numpy scalars as Python values"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+@dataclass(slots=True)
+class Alert:
+    """An alert raised for an organization (one line of the alert logs)"""
+    id: str
+    type: str
+    severity: str
+    organization: str
+    message: str
+    timestamp: datetime
+    data: dict
+
+# An unchanged set of alert conditions is re-written at most this often (keeping it in the 24h active window)
+ALERT_REFRESH_INTERVAL = timedelta(hours=1)
 
 class AlertSystem:
     """Manages alerts and notifications for the monitoring system"""
@@ -13,8 +55,19 @@ class AlertSystem:
         self.alerts_dir = self.data_dir / "alerts"
         self.alerts_dir.mkdir(exist_ok=True)
         
+        # SQLite index of the newest alert line per ID (the daily logs remain the durable record)
+        self.index_file = self.alerts_dir / "index.sqlite"
+        
         self.logger = logging.getLogger(__name__)
         
+        # Convert alert files left from before the daily alert logs
+        self.migrate_legacy_alert_files()
+        
+        # Parsed active alerts per hours window, with the alert index signature they were read at
+        # (alerts this process writes are merged in, so only other processes' writes cause a re-read)
+        self._active_cache = {}
+        self._active_cache_lock = threading.Lock()
+        
         # Alert thresholds
         self.thresholds = {
             'publication_drop_percent': 20,  # Alert if publications drop by 20%
@@ -33,26 +86,25 @@ class AlertSystem:
             if recent_data.empty:
                 return alerts
             
-            # Group by organization
-            org_groups = recent_data.groupby('org_id')
+            # Dates as datetime64 once (a no-op for the data manager's history), never per organization
+            recent_data['date'] = pd.to_datetime(recent_data['date'])
             
-            for org_id, org_data in org_groups:
-                org_name = org_data.iloc[0].get('organization_name', 'Unknown')
-                
-                # Check for publication drops
-                pub_drop_alert = self._check_publication_drop(org_data, org_name)
-                if pub_drop_alert:
-                    alerts.append(pub_drop_alert)
-                
-                # Check for stale data
-                stale_data_alert = self._check_stale_data(org_data, org_name)
-                if stale_data_alert:
-                    alerts.append(stale_data_alert)
-                
-                # Check for system availability
-                availability_alert = self._check_system_availability(org_data, org_name)
-                if availability_alert:
-                    alerts.append(availability_alert)
+            # Per-organization figures for all checks, computed in one vectorized pass
+            org_stats = self._get_org_stats(recent_data)
+            
+            # Each check returns its alerts keyed by org_id, for the flagged organizations only
+            now = datetime.now()
+            checks = [
+                self._check_publication_drop(org_stats, now),
+                self._check_stale_data(org_stats, now),
+                self._check_system_availability(org_stats, now)
+            ]
+            
+            # Alerts ordered by organization, then by check
+            for org_id in org_stats.index:
+                for check_alerts in checks:
+                    if org_id in check_alerts:
+                        alerts.append(check_alerts[org_id])
             
             # Save alerts
             if alerts:
@@ -64,156 +116,361 @@ class AlertSystem:
             self.logger.error(f"Error checking alerts: {e}")
             return []
     
-    def _check_publication_drop(self, org_data, org_name):
+    def _get_org_stats(self, recent_data):
+        """Aggregate the historical data to one row per organization (indexed by org_id, sorted)"""
+        # Sorted once so each organization's rows are one contiguous, date-ordered slice
+        history = recent_data.dropna(subset=['org_id']).sort_values(['org_id', 'date'], kind='stable')
+        org_ids, starts, days = np.unique(history['org_id'].to_numpy(), return_index=True, return_counts=True)
+        ends = starts + days
+        
+        # Row position from the end of each organization's history (0 = latest)
+        from_end = np.repeat(ends, days) - np.arange(len(history)) - 1
+        
+        # Last week (the latest 7 rows) and the week before (the 7 rows preceding them)
+        pubs = history['publications_recent'].to_numpy(dtype=float)
+        recent_avg = self._slice_means(pubs, starts, from_end < 7)
+        previous_avg = self._slice_means(pubs, starts, (from_end >= 7) & (from_end < 14))
+        
+        first_rows = history.iloc[starts]
+        latest_rows = history.iloc[ends - 1]
+        
+        return pd.DataFrame({
+            'organization_name': first_rows['organization_name'].to_numpy() if 'organization_name' in history else 'Unknown',
+            'days': days,
+            'recent_avg': recent_avg,
+            'previous_avg': previous_avg,
+            'data_freshness_days': latest_rows['data_freshness_days'].to_numpy() if 'data_freshness_days' in history else np.nan,
+            'last_publication_date': latest_rows['last_publication_date'].to_numpy() if 'last_publication_date' in history else None,
+            'latest_date': latest_rows['date'].to_numpy()
+        }, index=org_ids)
+    
+    def _slice_means(self, values, starts, mask):
+        """Mean of the masked, non-NaN values of each contiguous slice starting at starts (NaN when empty)"""
+        selected = mask & ~np.isnan(values)
+        sums = np.add.reduceat(np.where(selected, values, 0.0), starts)
+        counts = np.add.reduceat(selected.astype(np.int64), starts)
+        return np.divide(sums, counts, out=np.full(len(starts), np.nan), where=counts > 0)
+    
+    def _check_publication_drop(self, org_stats, now):
         """Check for drops in publication numbers"""
         try:
-            # Sort by date
-            org_data = org_data.sort_values('date')
-            
-            if len(org_data) < 7:  # Need at least a week of data
-                return None
+            # Compare recent week to previous week (needs at least a week of data), on plain float64 arrays
+            previous_pubs = org_stats['previous_avg'].to_numpy(dtype=np.float64)
+            recent_pubs = org_stats['recent_avg'].to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drop_percent = ((previous_pubs - recent_pubs) / previous_pubs) * 100
             
-            # Compare recent week to previous week
-            recent_pubs = org_data.tail(7)['publications_recent'].mean()
-            previous_pubs = org_data.iloc[-14:-7]['publications_recent'].mean()
+            flagged = (
+                (org_stats['days'].to_numpy() >= 7) &
+                (previous_pubs > 0) &
+                (drop_percent >= self.thresholds['publication_drop_percent'])
+            )
+            severities = np.where(drop_percent[flagged] < 50, 'warning', 'critical').tolist()
             
-            # Calculate percentage drop
-            if previous_pubs > 0:
-                drop_percent = ((previous_pubs - recent_pubs) / previous_pubs) * 100
-                
-                if drop_percent >= self.thresholds['publication_drop_percent']:
-                    return {
-                        'id': f"pub_drop_{org_data.iloc[0]['org_id']}",
-                        'type': 'Publication Drop',
-                        'severity': 'warning' if drop_percent < 50 else 'critical',
-                        'organization': org_name,
-                        'message': f"Publications dropped by {drop_percent:.1f}% ({previous_pubs:.1f} → {recent_pubs:.1f})",
-                        'timestamp': datetime.now(),
-                        'data': {
-                            'drop_percent': drop_percent,
-                            'previous_avg': previous_pubs,
-                            'recent_avg': recent_pubs
-                        }
+            return {
+                org_id: Alert(
+                    id=f"pub_drop_{org_id}",
+                    type='Publication Drop',
+                    severity=severity,
+                    organization=org_name,
+                    message=f"Publications dropped by {drop:.1f}% ({previous:.1f} → {recent:.1f})",
+                    timestamp=now,
+                    data={
+                        'drop_percent': drop,
+                        'previous_avg': previous,
+                        'recent_avg': recent
                     }
-            
-            return None
+                )
+                for org_id, org_name, severity, drop, previous, recent in zip(
+                    org_stats.index[flagged], org_stats['organization_name'].to_numpy()[flagged], severities,
+                    drop_percent[flagged].tolist(), previous_pubs[flagged].tolist(), recent_pubs[flagged].tolist()
+                )
+            }
             
         except Exception as e:
-            self.logger.error(f"Error checking publication drop for {org_name}: {e}")
-            return None
+            self.logger.error(f"Error checking publication drops: {e}")
+            return {}
     
-    def _check_stale_data(self, org_data, org_name):
+    def _check_stale_data(self, org_stats, now):
         """Check for stale or outdated data"""
         try:
-            # Get most recent data freshness
-            latest_data = org_data.sort_values('date').iloc[-1]
-            data_freshness_days = latest_data.get('data_freshness_days')
+            # Most recent data freshness of each organization
+            data_freshness = org_stats['data_freshness_days']
+            flagged = data_freshness >= self.thresholds['data_freshness_days']
+            severities = np.where(data_freshness[flagged] < 30, 'warning', 'critical').tolist()
             
-            if (data_freshness_days is not None and 
-                data_freshness_days >= self.thresholds['data_freshness_days']):
-                
-                severity = 'warning' if data_freshness_days < 30 else 'critical'
-                
-                return {
-                    'id': f"stale_data_{latest_data['org_id']}",
-                    'type': 'Stale Data',
-                    'severity': severity,
-                    'organization': org_name,
-                    'message': f"Data is {data_freshness_days} days old",
-                    'timestamp': datetime.now(),
-                    'data': {
+            return {
+                org_id: Alert(
+                    id=f"stale_data_{org_id}",
+                    type='Stale Data',
+                    severity=severity,
+                    organization=org_name,
+                    message=f"Data is {data_freshness_days} days old",
+                    timestamp=now,
+                    data={
                         'data_freshness_days': data_freshness_days,
-                        'last_publication_date': latest_data.get('last_publication_date')
+                        'last_publication_date': last_publication_date
                     }
-                }
-            
-            return None
+                )
+                for org_id, org_name, severity, data_freshness_days, last_publication_date in zip(
+                    org_stats.index[flagged], org_stats['organization_name'][flagged], severities, data_freshness[flagged],
+                    org_stats['last_publication_date'][flagged]
+                )
+            }
             
         except Exception as e:
-            self.logger.error(f"Error checking stale data for {org_name}: {e}")
-            return None
+            self.logger.error(f"Error checking stale data: {e}")
+            return {}
     
-    def _check_system_availability(self, org_data, org_name):
+    def _check_system_availability(self, org_stats, now):
         """Check for system availability issues"""
         try:
-            # Check if we have recent data
-            latest_date = pd.to_datetime(org_data['date'].max())
-            hours_since_update = (datetime.now() - latest_date).total_seconds() / 3600
+            # Hours since each organization's most recent data, as datetime64 arithmetic
+            latest_date = org_stats['latest_date']
+            hours_since_update = (np.datetime64(now) - latest_date.to_numpy()) / np.timedelta64(1, 'h')
+            flagged = hours_since_update >= self.thresholds['system_unavailable_hours']
             
-            if hours_since_update >= self.thresholds['system_unavailable_hours']:
-                return {
-                    'id': f"unavailable_{org_data.iloc[0]['org_id']}",
-                    'type': 'System Unavailable',
-                    'severity': 'critical',
-                    'organization': org_name,
-                    'message': f"No data updates for {hours_since_update:.1f} hours",
-                    'timestamp': datetime.now(),
-                    'data': {
-                        'hours_since_update': hours_since_update,
-                        'last_update': latest_date
+            return {
+                org_id: Alert(
+                    id=f"unavailable_{org_id}",
+                    type='System Unavailable',
+                    severity='critical',
+                    organization=org_name,
+                    message=f"No data updates for {hours:.1f} hours",
+                    timestamp=now,
+                    data={
+                        'hours_since_update': hours,
+                        'last_update': last_update
                     }
-                }
-            
-            return None
+                )
+                for org_id, org_name, hours, last_update in zip(
+                    org_stats.index[flagged], org_stats['organization_name'][flagged],
+                    hours_since_update[flagged].tolist(), latest_date[flagged]
+                )
+            }
             
         except Exception as e:
-            self.logger.error(f"Error checking system availability for {org_name}: {e}")
-            return None
+            self.logger.error(f"Error checking system availability: {e}")
+            return {}
     
     def _save_alerts(self, alerts):
-        """Save alerts to file"""
+        """Append alerts to today's alert log (one JSON object per line)"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            alerts_file = self.alerts_dir / f"alerts_{timestamp}.json"
+            # Skip the write when the same conditions (alert IDs and severities) were saved recently, by any process
+            now = datetime.now()
+            batch_hash = hashlib.blake2b(
+                repr(sorted((alert.id, alert.type, alert.severity) for alert in alerts)).encode(), digest_size=16
+            ).hexdigest()
+            last_saved_file = self.alerts_dir / ".last_saved"
+            try:
+                last_hash, last_saved = last_saved_file.read_text().split()
+                if last_hash == batch_hash and now - datetime.fromisoformat(last_saved) < ALERT_REFRESH_INTERVAL:
+                    self.logger.debug("Alerts unchanged since the last save, not written")
+                    return
+            except (OSError, ValueError):
+                pass
+            
+            alerts_file = self.alerts_dir / f"alerts_{now.strftime('%Y%m%d')}.jsonl"
+            previous_signature = self._index_signature()
+            
+            # Datetimes are converted inline by the encoder (natively by orjson, pandas Timestamps via the hook)
+            if orjson is not None:
+                lines = [orjson.dumps(alert, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY) for alert in alerts]
+            else:
+                lines = [json.dumps(asdict(alert), default=json_default).encode() for alert in alerts]
             
-            # Convert datetime objects to strings for JSON serialization
-            alerts_json = []
-            for alert in alerts:
-                alert_copy = alert.copy()
-                alert_copy['timestamp'] = alert_copy['timestamp'].isoformat()
-                alerts_json.append(alert_copy)
+            with open(alerts_file, 'ab', buffering=64 * 1024) as f:
+                for line in lines:
+                    f.write(line + b'\n')
             
-            with open(alerts_file, 'w') as f:
-                json.dump(alerts_json, f, indent=2)
+            with closing(self._connect_index()) as connection, connection:
+                self._index_lines(connection, [(alert.id, alert.timestamp.timestamp(), line) for alert, line in zip(alerts, lines)])
             
             self.logger.info(f"Saved {len(alerts)} alerts to {alerts_file}")
+            last_saved_file.write_text(f"{batch_hash} {now.isoformat()}")
+            
+            self._merge_into_active_cache(previous_signature, alerts)
+            self._compress_old_alert_logs()
             
         except Exception as e:
             self.logger.error(f"Error saving alerts: {e}")
     
+    def _connect_index(self):
+        """Open the alert index, creating it from the alert logs when it does not exist yet"""
+        new_index = not self.index_file.exists()
+        connection = sqlite3.connect(self.index_file, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS alerts (id TEXT PRIMARY KEY, ts REAL NOT NULL, line BLOB NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS alerts_ts ON alerts (ts)")
+        
+        if new_index:
+            with connection:
+                self._rebuild_index(connection)
+        return connection
+    
+    def _index_lines(self, connection, rows):
+        """Upsert (id, epoch timestamp, JSON line) rows, keeping the newest line per alert ID"""
+        connection.executemany(
+            "INSERT INTO alerts (id, ts, line) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET ts = excluded.ts, line = excluded.line WHERE excluded.ts > alerts.ts",
+            rows
+        )
+    
+    def _rebuild_index(self, connection):
+        """Index every alert in the daily logs (plain or zstd-compressed)"""
+        json_loads = orjson.loads if orjson is not None else json.loads
+        with os.scandir(self.alerts_dir) as entries:
+            log_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.startswith('alerts_') and entry.name.endswith(('.jsonl', '.jsonl.zst'))
+            )
+        
+        for alert_file in log_files:
+            if alert_file.suffix == '.zst' and zstandard is None:
+                continue
+            try:
+                with open(alert_file, 'rb') as f:
+                    lines = f
+                    if alert_file.suffix == '.zst':
+                        lines = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(f))
+                    rows = []
+                    for line in lines:
+                        line = line.rstrip(b'\n')
+                        if not line.strip():
+                            continue
+                        alert = json_loads(line)
+                        rows.append((alert['id'], datetime.fromisoformat(alert['timestamp']).timestamp(), line))
+                    self._index_lines(connection, rows)
+            except Exception as e:
+                self.logger.error(f"Error indexing alert file {alert_file}: {e}")
+    
+    def migrate_legacy_alert_files(self):
+        """Rewrite legacy alert files (a JSON array each, possibly zstd-compressed) as alert logs and index their alerts"""
+        with os.scandir(self.alerts_dir) as entries:
+            legacy_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.startswith('alerts_') and entry.name.endswith(('.json', '.json.zst'))
+            )
+        if not legacy_files:
+            return
+        
+        with closing(self._connect_index()) as connection:
+            for legacy_file in legacy_files:
+                if legacy_file.suffix == '.zst' and zstandard is None:
+                    continue
+                try:
+                    with open(legacy_file, 'rb') as f:
+                        content = f.read() if legacy_file.suffix != '.zst' else zstandard.ZstdDecompressor().stream_reader(f).read()
+                    alerts = json.loads(content)
+                    
+                    # Same name without the extension, e.g. alerts_20250101_020000.jsonl, next to the daily logs
+                    if orjson is not None:
+                        lines = [orjson.dumps(alert) for alert in alerts]
+                    else:
+                        lines = [json.dumps(alert).encode() for alert in alerts]
+                    log_file = self.alerts_dir / f"{legacy_file.name.split('.')[0]}.jsonl"
+                    with open(log_file, 'wb') as f:
+                        f.writelines(line + b'\n' for line in lines)
+                    
+                    with connection:
+                        self._index_lines(connection, [
+                            (alert['id'], datetime.fromisoformat(alert['timestamp']).timestamp(), line)
+                            for alert, line in zip(alerts, lines)
+                        ])
+                    legacy_file.unlink()
+                    self.logger.info(f"Migrated {legacy_file.name} to {log_file.name}")
+                    
+                except FileNotFoundError:
+                    continue  # Migrated by another process in the meantime
+                except Exception as e:
+                    self.logger.error(f"Error migrating alert file {legacy_file.name}: {e}")
+    
+    def _index_signature(self):
+        """Size and mtime of the alert index and its write-ahead log, which change with every write"""
+        signature = []
+        for index_file in (self.index_file, self.index_file.with_name(self.index_file.name + '-wal')):
+            try:
+                file_stat = index_file.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((file_stat.st_size, file_stat.st_mtime_ns))
+        return tuple(signature)
+    
+    def _compress_old_alert_logs(self):
+        """Compress alert logs not written to for 24 hours with zstd"""
+        if zstandard is None:
+            return
+        
+        cutoff_time = (datetime.now() - timedelta(hours=24)).timestamp()
+        compressor = zstandard.ZstdCompressor(level=3)
+        with os.scandir(self.alerts_dir) as entries:
+            old_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith('alerts_') and entry.name.endswith('.jsonl')
+                and entry.stat(follow_symlinks=False).st_mtime < cutoff_time
+            ]
+        
+        for alert_file in old_files:
+            try:
+                compressed_file = alert_file.with_name(alert_file.name + '.zst')
+                compressed_file.write_bytes(compressor.compress(alert_file.read_bytes()))
+                alert_file.unlink()
+            except Exception as e:
+                self.logger.error(f"Error compressing alert file {alert_file}: {e}")
+    
+    def _merge_into_active_cache(self, previous_signature, alerts):
+        """Add just-written alerts to the cached active alerts read at the index state before the write"""
+        written_signature = self._index_signature()
+        
+        with self._active_cache_lock:
+            for hours, (index_signature, cached_alerts) in list(self._active_cache.items()):
+                if index_signature != previous_signature:
+                    # The index changed in between (another process wrote to it): re-read on the next call
+                    del self._active_cache[hours]
+                    continue
+                
+                # Keep the newest alert per ID, newest first
+                latest_alerts = {alert.id: alert for alert in cached_alerts}
+                for alert in alerts:
+                    current = latest_alerts.get(alert.id)
+                    if current is None or alert.timestamp > current.timestamp:
+                        latest_alerts[alert.id] = replace(alert)
+                self._active_cache[hours] = (
+                    written_signature,
+                    sorted(latest_alerts.values(), key=lambda x: x.timestamp, reverse=True)
+                )
+    
     def get_active_alerts(self, hours=24):
         """Get active alerts from the last N hours"""
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
-            active_alerts = []
             
-            # Read all recent alert files
-            for alert_file in self.alerts_dir.glob("alerts_*.json"):
-                try:
-                    file_time = datetime.fromtimestamp(alert_file.stat().st_mtime)
-                    if file_time >= cutoff_time:
-                        with open(alert_file, 'r') as f:
-                            alerts = json.load(f)
-                            for alert in alerts:
-                                alert['timestamp'] = datetime.fromisoformat(alert['timestamp'])
-                                if alert['timestamp'] >= cutoff_time:
-                                    active_alerts.append(alert)
-                except Exception as e:
-                    self.logger.error(f"Error reading alert file {alert_file}: {e}")
-                    continue
+            # Unchanged alert index: reuse the parsed alerts, re-applying the cutoff
+            index_signature = self._index_signature()
+            cached = self._active_cache.get(hours)
+            if cached is not None and cached[0] == index_signature:
+                return [alert for alert in cached[1] if alert.timestamp >= cutoff_time]
             
-            # Sort by timestamp (newest first) and remove duplicates
-            active_alerts.sort(key=lambda x: x['timestamp'], reverse=True)
+            # The index holds only the newest alert per ID, so the window is one range query on ts (newest first)
+            with closing(self._connect_index()) as connection:
+                rows = connection.execute(
+                    "SELECT line FROM alerts WHERE ts >= ? ORDER BY ts DESC", (cutoff_time.timestamp(),)
+                ).fetchall()
             
-            # Remove duplicate alerts (same ID)
-            seen_ids = set()
+            json_loads = orjson.loads if orjson is not None else json.loads
             unique_alerts = []
-            for alert in active_alerts:
-                if alert['id'] not in seen_ids:
-                    unique_alerts.append(alert)
-                    seen_ids.add(alert['id'])
+            for (line,) in rows:
+                alert = json_loads(line)
+                alert['timestamp'] = datetime.fromisoformat(alert['timestamp'])
+                # Interned: all alerts share one string object per severity/type, and == between
+                # two interned copies takes the identity fast path before comparing characters
+                alert['severity'] = sys.intern(alert['severity'])
+                alert['type'] = sys.intern(alert['type'])
+                unique_alerts.append(Alert(**alert))
             
-            return unique_alerts
+            self._active_cache[hours] = (index_signature, unique_alerts)
+            return list(unique_alerts)
             
         except Exception as e:
             self.logger.error(f"Error getting active alerts: {e}")
@@ -224,18 +481,20 @@ class AlertSystem:
         try:
             active_alerts = self.get_active_alerts(24)
             
+            # Count by severity and type in one pass
+            severity_counts = Counter()
+            type_counts = Counter()
+            for alert in active_alerts:
+                severity_counts[alert.severity] += 1
+                type_counts[alert.type] += 1
+            
             summary = {
                 'total_alerts': len(active_alerts),
-                'critical_alerts': len([a for a in active_alerts if a['severity'] == 'critical']),
-                'warning_alerts': len([a for a in active_alerts if a['severity'] == 'warning']),
-                'alert_types': {}
+                'critical_alerts': severity_counts['critical'],
+                'warning_alerts': severity_counts['warning'],
+                'alert_types': dict(type_counts)
             }
             
-            # Count by type
-            for alert in active_alerts:
-                alert_type = alert['type']
-                summary['alert_types'][alert_type] = summary['alert_types'].get(alert_type, 0) + 1
-            
             return summary
             
         except Exception as e:
@@ -256,4 +515,4 @@ class AlertSystem:
         # - Push notifications
         # - SMS
         
-        self.logger.info(f"Notification sent for alert: {alert['type']} - {alert['organization']}")
+        self.logger.info(f"Notification sent for alert: {alert.type} - {alert.organization}")
@@ -3,12 +3,128 @@ import requests
 import yaml
 import pandas as pd
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import os
 import time
 import logging
+import logging.handlers
+import queue
+import atexit
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Worker threads for the independent requests of one organization (the session pool holds 16 connections)
+STATS_WORKERS = 8
+
+# Prefix of the OpenOrgs organization IDs returned for a ROR link
+OPENORGS_PREFIX = 'openorgs____::'
+
+# Fields of the first result kept as sample in the API log (publications and data sources)
+SAMPLE_RESULT_FIELDS = ('id', 'title', 'resulttype', 'dateofcollection', 'officialname', 'datasourcetype')
+
+# Access token kept between runs (owner-readable only; not picked up by the log views, which list *.log)
+TOKEN_CACHE_FILE = Path("logs") / ".oauth_token.json"
+
+# Days of dated API log files kept besides the current one
+API_LOG_BACKUP_DAYS = 14
+
+# Newest publications checked for the recent count and data freshness (the stats request asks for just these)
+STATS_PUBLICATIONS = 50
+
+# Organizations handled at the same time by the get_many_* batch methods (stats take two requests each)
+BATCH_WORKERS = 4
+
+def json_default(obj):
+    """Serialize values the JSON encoder does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+# Compact single-line JSON for the API log, with orjson when available
+if orjson is not None:
+    def json_dumps(obj):
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), default=json_default)
+
+class DailyFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Midnight rollover that moves on to a new <prefix>YYYYMMDD.log file instead of renaming the current one
+    
+    Nothing is renamed, so the app and the collector process can safely log to the same dated files.
+    """
+    
+    def __init__(self, logs_dir, prefix, backupCount=0):
+        self.logs_dir = Path(logs_dir)
+        self.prefix = prefix
+        super().__init__(self.dated_path(), when='midnight', backupCount=backupCount, encoding='utf-8', delay=True)
+    
+    def dated_path(self):
+        """Get the log file for the current day"""
+        return self.logs_dir / f"{self.prefix}{datetime.now().strftime('%Y%m%d')}.log"
+    
+    def doRollover(self):
+        """Switch to the new day's file and remove the dated files beyond backupCount"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.baseFilename = os.path.abspath(self.dated_path())
+        
+        if self.backupCount > 0:
+            # Dated names sort chronologically; keep the current file and backupCount older ones
+            dated_files = sorted(self.logs_dir.glob(f"{self.prefix}*.log"))
+            current = Path(self.baseFilename).name
+            older_files = [path for path in dated_files if path.name < current]
+            for path in older_files[:-self.backupCount]:
+                path.unlink(missing_ok=True)
+        
+        self.rolloverAt = self.computeRollover(int(time.time()))
+        if not self.delay:
+            self.stream = self._open()
+
+# API log handler shared by all clients of the process: attached for the first open client, removed after the last
+_api_log_lock = threading.Lock()
+_api_log = {'clients': 0, 'queue_handler': None, 'listener': None, 'file_handler': None}
+
+def acquire_api_log_handler(api_logger, logs_dir):
+    """Attach the API log queue handler (starting its writer thread) unless another open client already did"""
+    with _api_log_lock:
+        if _api_log['clients'] == 0:
+            # Dated file handler (it switches to the next dated file at midnight by itself)
+            file_handler = DailyFileHandler(logs_dir, "api_requests_", backupCount=API_LOG_BACKUP_DAYS)
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+            
+            # Requests only enqueue their log records; a background listener thread writes the file
+            log_queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            api_logger.addHandler(queue_handler)
+            _api_log.update(queue_handler=queue_handler, listener=listener, file_handler=file_handler)
+        _api_log['clients'] += 1
+
+def release_api_log_handler(api_logger):
+    """Detach the API log queue handler and stop its writer thread when the last open client is closed"""
+    with _api_log_lock:
+        _api_log['clients'] -= 1
+        if _api_log['clients'] == 0:
+            api_logger.removeHandler(_api_log['queue_handler'])
+            _api_log['listener'].stop()  # Writes out the records still queued
+            atexit.unregister(_api_log['listener'].stop)
+            _api_log['file_handler'].close()
+            _api_log.update(queue_handler=None, listener=None, file_handler=None)
+
 class OpenAIREClient:
     """Client for interacting with OpenAIRE Graph API"""
     
@@ -20,12 +136,54 @@ class OpenAIREClient:
         self.auth_url = config['auth_url']
         self.access_token = None
         self.token_expires_at = None
+        self._token_deadline = None  # time.monotonic() reading at which the token is refreshed
+        
+        # Pooled keep-alive connections shared by all requests of this client
+        self.session = self.create_session()
+        
+        # Runs independent requests concurrently over the shared session
+        self._executor = ThreadPoolExecutor(max_workers=STATS_WORKERS)
         
         # Setup comprehensive logging
+        self._api_log_acquired = False
         self.setup_logging()
         
+        # OpenAIRE org IDs already resolved, by ROR link
+        self._org_id_cache = {}
+        
+        # Reuse a still-valid token from a previous run
+        self.load_cached_token()
+        
         # Initialize API request counter for this session
         self.request_counter = 0
+        self._counter_lock = threading.Lock()
+    
+    def create_session(self):
+        """Create an HTTP session with a connection pool and retries on rate limiting and transient gateway errors"""
+        session = requests.Session()
+        # Ask for JSON explicitly; requests already advertises (and transparently decodes) gzip/deflate
+        session.headers['Accept'] = 'application/json'
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST"],  # The token request is safe to repeat
+            raise_on_status=False  # Hand the last response to the normal status handling
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def close(self):
+        """Shut down the worker threads, the API log listener and the pooled connections of this client"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        
+        # The API log handler is shared by all open clients; the last one to close removes it
+        if self._api_log_acquired:
+            self._api_log_acquired = False
+            release_api_log_handler(self.api_logger)
     
     def setup_logging(self):
         """Setup comprehensive API logging system"""
@@ -42,25 +200,10 @@ class OpenAIREClient:
             self.api_logger = logging.getLogger(f"{__name__}.api")
             self.api_logger.setLevel(logging.INFO)
             
-            # Create API log file handler with date-based naming
-            today = datetime.now().strftime('%Y%m%d')
-            api_log_file = self.logs_dir / f"api_requests_{today}.log"
-            
-            # Create file handler if it doesn't exist
-            if not hasattr(self, '_api_file_handler') or self._current_log_date != today:
-                if hasattr(self, '_api_file_handler'):
-                    self.api_logger.removeHandler(self._api_file_handler)
-                
-                self._api_file_handler = logging.FileHandler(api_log_file)
-                self._api_file_handler.setLevel(logging.INFO)
-                
-                # Create detailed formatter for API logs
-                api_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                )
-                self._api_file_handler.setFormatter(api_formatter)
-                self.api_logger.addHandler(self._api_file_handler)
-                self._current_log_date = today
+            # Write API records to the dated API log file, through one handler however many clients are open
+            if not self._api_log_acquired:
+                acquire_api_log_handler(self.api_logger, self.logs_dir)
+                self._api_log_acquired = True
             
             # Prevent duplicate logs in root logger
             self.api_logger.propagate = False
@@ -72,85 +215,102 @@ class OpenAIREClient:
             self.api_logger = self.logger
     
     def log_api_request(self, method, url, params=None, headers=None, response=None, 
-                       start_time=None, end_time=None, error=None, context=None):
-        """Log detailed API request and response information"""
+                       start_time=None, end_time=None, error=None, context=None, parsed_json=None):
+        """Log detailed API request and response information (parsed_json: the already decoded response body)"""
         try:
-            self.request_counter += 1
+            # Requests may be logged from several worker threads
+            with self._counter_lock:
+                self.request_counter += 1
+                request_number = self.request_counter
             
-            # Calculate response time
+            # Calculate response time (start_time and end_time are time.monotonic() readings)
             response_time_ms = None
-            if start_time and end_time:
+            if start_time is not None and end_time is not None:
                 response_time_ms = round((end_time - start_time) * 1000, 2)
             
-            # Create structured log entry
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "request_id": f"req_{self.request_counter}_{int(time.time())}",
-                "method": method,
-                "url": url,
-                "parameters": params or {},
-                "context": context or {},
-                "response_time_ms": response_time_ms,
-                "success": error is None and (response is not None and hasattr(response, 'status_code') and response.status_code == 200)
-            }
-            
-            # Add response information
-            if response is not None:
-                log_entry.update({
-                    "status_code": getattr(response, 'status_code', None),
-                    "response_headers": dict(getattr(response, 'headers', {})),
-                    "response_size_bytes": len(getattr(response, 'content', b''))
-                })
+            success = error is None and (response is not None and hasattr(response, 'status_code') and response.status_code == 200)
+            
+            # Only build the detailed entry when the API log would record it
+            if self.api_logger.isEnabledFor(logging.INFO):
+                # Create structured log entry (one clock reading for the timestamp and the request ID)
+                now = datetime.now()
+                log_entry = {
+                    "timestamp": now,  # Serialized to ISO format by the encoder
+                    "request_id": f"req_{request_number}_{int(now.timestamp())}",
+                    "method": method,
+                    "url": url,
+                    "parameters": params or {},
+                    "context": context or {},
+                    "response_time_ms": response_time_ms,
+                    "success": success
+                }
                 
-                # Add response content (truncated for large responses)
-                try:
-                    if hasattr(response, 'json'):
-                        response_json = response.json()
-                        # Truncate large responses for logging
-                        if isinstance(response_json, dict):
-                            if 'results' in response_json and isinstance(response_json['results'], list):
-                                # Log summary for results arrays
-                                log_entry["response_summary"] = {
-                                    "total_results": response_json.get('total', len(response_json['results'])),
-                                    "returned_results": len(response_json['results']),
-                                    "has_more": response_json.get('hasMore', False)
-                                }
-                                # Include first result as sample (truncated)
-                                if response_json['results']:
-                                    first_result = response_json['results'][0]
-                                    log_entry["sample_result"] = str(first_result)[:500] + "..." if len(str(first_result)) > 500 else first_result
-                            else:
-                                # For non-results responses, log the full content (truncated)
-                                response_str = str(response_json)
-                                log_entry["response_content"] = response_str[:1000] + "..." if len(response_str) > 1000 else response_json
-                    else:
-                        # For non-JSON responses
-                        response_text = getattr(response, 'text', '')
-                        log_entry["response_content"] = response_text[:500] + "..." if len(response_text) > 500 else response_text
-                        
-                except Exception as json_error:
-                    log_entry["response_parse_error"] = str(json_error)
-                    log_entry["response_content"] = getattr(response, 'text', '')[:200]
-            
-            # Add error information
-            if error is not None:
-                log_entry.update({
-                    "error": str(error),
-                    "error_type": type(error).__name__
-                })
-            
-            # Log as JSON string
-            self.api_logger.info(json.dumps(log_entry, indent=2))
+                # Add response information
+                if response is not None:
+                    response_headers = getattr(response, 'headers', {})
+                    content_length = response_headers.get('Content-Length')
+                    log_entry.update({
+                        "status_code": getattr(response, 'status_code', None),
+                        # Bytes on the wire as declared by the server, without touching the body
+                        "response_size_bytes": int(content_length) if content_length else None
+                    })
+                    # Full response headers only when the API log is at DEBUG level
+                    if self.api_logger.isEnabledFor(logging.DEBUG):
+                        log_entry["response_headers"] = dict(response_headers)
+                    
+                    # Add response content (truncated for large responses)
+                    try:
+                        if parsed_json is not None or hasattr(response, 'json'):
+                            response_json = parsed_json if parsed_json is not None else response.json()
+                            # Truncate large responses for logging
+                            if isinstance(response_json, dict):
+                                if 'results' in response_json and isinstance(response_json['results'], list):
+                                    # Log summary for results arrays
+                                    log_entry["response_summary"] = {
+                                        "total_results": response_json.get('total', len(response_json['results'])),
+                                        "returned_results": len(response_json['results']),
+                                        "has_more": response_json.get('hasMore', False)
+                                    }
+                                    # Include the identifying fields of the first result as sample (truncated)
+                                    if response_json['results']:
+                                        first_result = response_json['results'][0]
+                                        sample = {field: first_result[field] for field in SAMPLE_RESULT_FIELDS if field in first_result}
+                                        sample_str = json_dumps(sample)
+                                        log_entry["sample_result"] = sample_str[:500] + "..." if len(sample_str) > 500 else sample
+                                else:
+                                    # For non-results responses, log the full content (truncated)
+                                    response_str = str(response_json)
+                                    log_entry["response_content"] = response_str[:1000] + "..." if len(response_str) > 1000 else response_json
+                        else:
+                            # For non-JSON responses
+                            response_text = getattr(response, 'text', '')
+                            log_entry["response_content"] = response_text[:500] + "..." if len(response_text) > 500 else response_text
+                            
+                    except Exception as json_error:
+                        log_entry["response_parse_error"] = str(json_error)
+                        log_entry["response_content"] = getattr(response, 'text', '')[:200]
+                
+                # Add error information
+                if error is not None:
+                    log_entry.update({
+                        "error": str(error),
+                        "error_type": type(error).__name__
+                    })
+                
+                # Log as a single-line JSON string (one entry per line)
+                self.api_logger.info(json_dumps(log_entry))
             
             # Also log summary to standard logger
-            status = "SUCCESS" if log_entry["success"] else "FAILED"
+            if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+                return
+            status = "SUCCESS" if success else "FAILED"
             summary = f"API {method} {status}: {url}"
             if response_time_ms:
                 summary += f" ({response_time_ms}ms)"
             if hasattr(response, 'status_code'):
                 summary += f" [HTTP {response.status_code}]"
             
-            if log_entry["success"]:
+            if success:
                 self.logger.info(summary)
             else:
                 self.logger.error(summary)
@@ -161,28 +321,65 @@ class OpenAIREClient:
             if response:
                 self.logger.info(f"API Request: {method} {url} -> {getattr(response, 'status_code', 'Unknown')}")
     
+    def load_cached_token(self):
+        """Load the access token cached on disk if it belongs to this client and is still valid"""
+        try:
+            if not TOKEN_CACHE_FILE.exists():
+                return
+            
+            with open(TOKEN_CACHE_FILE) as f:
+                cached = json.load(f)
+            
+            expires_at = datetime.fromisoformat(cached['expires_at'])
+            if cached.get('client_id') == self.client_id and expires_at > datetime.now() + timedelta(minutes=1):
+                self.access_token = cached['access_token']
+                self.token_expires_at = expires_at
+                self._token_deadline = time.monotonic() + (expires_at - datetime.now()).total_seconds()
+                self.logger.info("Using cached access token")
+                
+        except Exception as e:
+            self.logger.warning(f"Could not load cached access token: {e}")
+    
+    def save_cached_token(self):
+        """Write the access token and its expiry to disk atomically, readable by the owner only"""
+        try:
+            TOKEN_CACHE_FILE.parent.mkdir(exist_ok=True)
+            tmp_file = TOKEN_CACHE_FILE.with_suffix('.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'client_id': self.client_id,
+                    'access_token': self.access_token,
+                    'expires_at': self.token_expires_at.isoformat()
+                }, f)
+            os.replace(tmp_file, TOKEN_CACHE_FILE)
+            
+        except Exception as e:
+            self.logger.warning(f"Could not cache access token: {e}")
+    
     def get_access_token(self):
         """Get or refresh the access token"""
-        start_time = time.time()
+        start_time = time.monotonic()
         response = None
         error = None
         
         try:
             # Check if we need a new token
             if (self.access_token is None or 
-                self.token_expires_at is None or 
-                datetime.now() >= self.token_expires_at):
+                self._token_deadline is None or 
+                time.monotonic() >= self._token_deadline):
                 
                 self.logger.info("Requesting new access token...")
                 
-                response = requests.post(
+                response = self.session.post(
                     self.auth_url,
                     data={'grant_type': 'client_credentials'},
                     auth=HTTPBasicAuth(self.client_id, self.client_secret),
                     timeout=30
                 )
                 
-                end_time = time.time()
+                end_time = time.monotonic()
+                token_data = response.json() if response.status_code == 200 else None
                 
                 # Log the authentication request
                 self.log_api_request(
@@ -192,14 +389,16 @@ class OpenAIREClient:
                     response=response,
                     start_time=start_time,
                     end_time=end_time,
-                    context={"operation": "get_access_token", "token_refresh": True}
+                    context={"operation": "get_access_token", "token_refresh": True},
+                    parsed_json=token_data
                 )
                 
                 if response.status_code == 200:
-                    token_data = response.json()
                     self.access_token = token_data.get('access_token')
                     expires_in = token_data.get('expires_in', 3600)  # Default 1 hour
                     self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 300)  # 5 min buffer
+                    self._token_deadline = time.monotonic() + expires_in - 300
+                    self.save_cached_token()
                     self.logger.info("Access token obtained successfully")
                     return self.access_token
                 else:
@@ -211,7 +410,7 @@ class OpenAIREClient:
             
         except Exception as e:
             error = e
-            end_time = time.time()
+            end_time = time.monotonic()
             
             # Log the failed authentication request
             self.log_api_request(
@@ -229,84 +428,54 @@ class OpenAIREClient:
             return None
     
     def make_authenticated_request(self, url, params=None, context=None):
-        """Make an authenticated request to the OpenAIRE API"""
-        start_time = time.time()
-        response = None
-        error = None
-        retry_attempted = False
-        
-        token = self.get_access_token()
-        if not token:
-            # Log failed request due to no token
-            self.log_api_request(
-                method="GET",
-                url=url,
-                params=params,
-                start_time=start_time,
-                end_time=time.time(),
-                error="No access token available",
-                context=context or {}
-            )
-            return None
-        
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            end_time = time.time()
+        """Make an authenticated request to the OpenAIRE API, refreshing the token and retrying once on 401"""
+        for attempt in range(2):
+            start_time = time.monotonic()
+            attempt_context = dict(context or {}, attempt=attempt)
             
-            if response.status_code == 200:
-                # Log successful request
+            token = self.get_access_token()
+            if not token:
+                # Log failed request due to no token
                 self.log_api_request(
                     method="GET",
                     url=url,
                     params=params,
-                    headers=headers,
-                    response=response,
                     start_time=start_time,
-                    end_time=end_time,
-                    context=context or {}
+                    end_time=time.monotonic(),
+                    error="No access token available",
+                    context=attempt_context
                 )
-                return response.json()
+                return None
+            
+            headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            
+            try:
+                response = self.session.get(url, headers=headers, params=params, timeout=30)
+                end_time = time.monotonic()
                 
-            elif response.status_code == 401:
-                # Token might be expired, try once more
-                self.logger.info("Token appears expired, attempting refresh...")
-                self.access_token = None
-                token = self.get_access_token()
+                # Decode once, for both the log entry and the caller
+                data = response.json() if response.status_code == 200 else None
                 
-                if token:
-                    retry_attempted = True
-                    retry_start = time.time()
-                    headers['Authorization'] = f'Bearer {token}'
-                    response = requests.get(url, headers=headers, params=params, timeout=30)
-                    retry_end = time.time()
-                    
-                    # Log the retry attempt
-                    retry_context = (context or {}).copy()
-                    retry_context.update({"retry_attempt": True, "original_status": 401})
-                    
-                    self.log_api_request(
-                        method="GET",
-                        url=url,
-                        params=params,
-                        headers=headers,
-                        response=response,
-                        start_time=retry_start,
-                        end_time=retry_end,
-                        context=retry_context
-                    )
-                    
-                    if response.status_code == 200:
-                        return response.json()
-            
-            # Log failed request
-            failed_context = (context or {}).copy()
-            failed_context.update({"retry_attempted": retry_attempted})
+            except Exception as e:
+                # Log exception
+                self.log_api_request(
+                    method="GET",
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    start_time=start_time,
+                    end_time=time.monotonic(),
+                    error=e,
+                    context=attempt_context
+                )
+                
+                self.logger.error(f"Error making API request: {e}")
+                return None
             
+            # One log entry per attempt
             self.log_api_request(
                 method="GET",
                 url=url,
@@ -315,37 +484,28 @@ class OpenAIREClient:
                 response=response,
                 start_time=start_time,
                 end_time=end_time,
-                context=failed_context
+                context=attempt_context,
+                parsed_json=data
             )
             
-            self.logger.error(f"API request failed: {response.status_code} - {response.text[:200]}")
-            return None
-            
-        except Exception as e:
-            error = e
-            end_time = time.time()
-            
-            # Log exception
-            exception_context = (context or {}).copy()
-            exception_context.update({"retry_attempted": retry_attempted})
+            if response.status_code == 200:
+                return data
             
-            self.log_api_request(
-                method="GET",
-                url=url,
-                params=params,
-                headers=headers,
-                response=response,
-                start_time=start_time,
-                end_time=end_time,
-                error=error,
-                context=exception_context
-            )
+            if response.status_code != 401 or attempt == 1:
+                break
             
-            self.logger.error(f"Error making API request: {e}")
-            return None
+            # Token might be expired, try once more
+            self.logger.info("Token appears expired, attempting refresh...")
+            self.access_token = None
+        
+        self.logger.error(f"API request failed: {response.status_code} - {response.text[:200]}")
+        return None
     
     def get_organization_id(self, ror_link):
-        """Get OpenAIRE organization ID from ROR link"""
+        """Get OpenAIRE organization ID from ROR link (found IDs are remembered for the life of the client)"""
+        if ror_link in self._org_id_cache:
+            return self._org_id_cache[ror_link]
+        
         try:
             url = f"{self.api_base_url}organizations"
             params = {'pid': ror_link}
@@ -359,8 +519,9 @@ class OpenAIREClient:
             if response and 'results' in response:
                 for result in response['results']:
                     org_id = result.get('id', '')
-                    if org_id.startswith('openorgs____::'):
+                    if org_id.startswith(OPENORGS_PREFIX):
                         self.logger.info(f"Found organization ID {org_id} for ROR link {ror_link}")
+                        self._org_id_cache[ror_link] = org_id
                         return org_id
             
             self.logger.warning(f"No organization ID found for ROR link {ror_link}")
@@ -370,17 +531,26 @@ class OpenAIREClient:
             self.logger.error(f"Error getting organization ID for {ror_link}: {e}")
             return None
     
-    def get_organization_publications(self, org_id, from_date=None, to_date=None):
-        """Get publications for an organization"""
+    def get_many_organization_ids(self, ror_links):
+        """Get OpenAIRE organization IDs for several ROR links, a bounded number at a time, in the order given"""
+        self.get_access_token()
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as batch_executor:
+            return list(batch_executor.map(self.get_organization_id, ror_links))
+    
+    def get_organization_publications(self, org_id, from_date=None, to_date=None, size=100, cursor=None):
+        """Get a page of publications for an organization, newest collected first (cursor: from the previous page)"""
         try:
             url = f"{self.api_base_url}results"
             params = {
                 'format': 'json',
-                'size': 100,
+                'size': size,
                 'sortBy': 'dateofcollection',
                 'sortOrder': 'desc'
             }
             
+            if cursor:
+                params['cursor'] = cursor
+            
             # Add organization filter
             if org_id:
                 params['fq'] = f'(reltypevalue exact "isProducedBy") AND (relorganizationid exact "{org_id}")'
@@ -414,6 +584,17 @@ class OpenAIREClient:
             self.logger.error(f"Error getting publications for {org_id}: {e}")
             return None
     
+    def iter_publications(self, org_id, from_date=None, to_date=None, size=100):
+        """Yield an organization's publications page by page, following the API's result cursor"""
+        cursor = '*'
+        while cursor:
+            page = self.get_organization_publications(org_id, from_date, to_date, size=size, cursor=cursor)
+            if not page or not page.get('results'):
+                return
+            yield page
+            # Graph API v1 returns the cursor of the next page in the response header block
+            cursor = (page.get('header') or {}).get('nextCursor') or page.get('nextCursor')
+    
     def get_data_sources(self, org_id):
         """Get data sources for an organization"""
         try:
@@ -444,9 +625,9 @@ class OpenAIREClient:
             self.logger.error(f"Error getting data sources for {org_id}: {e}")
             return None
     
-    def get_organization_stats(self, org_id):
-        """Get comprehensive statistics for an organization"""
-        start_time = time.time()
+    def get_organization_stats(self, org_id, publications=None, data_sources=None):
+        """Get comprehensive statistics for an organization, reusing publications / data sources responses already fetched"""
+        start_time = time.monotonic()
         
         try:
             self.logger.info(f"Starting comprehensive stats collection for organization {org_id}")
@@ -462,27 +643,28 @@ class OpenAIREClient:
                 'data_freshness_days': None
             }
             
-            # Get publications
-            publications = self.get_organization_publications(org_id)
+            # Fetch the token once up front, then request whatever was not passed in concurrently
+            if publications is None or data_sources is None:
+                self.get_access_token()
+            if publications is None:
+                publications_future = self._executor.submit(self.get_organization_publications, org_id, size=STATS_PUBLICATIONS)
+            if data_sources is None:
+                data_sources_future = self._executor.submit(self.get_data_sources, org_id)
+            
+            if publications is None:
+                publications = publications_future.result()
             if publications and 'results' in publications:
                 stats['publications_total'] = publications.get('total', 0)
                 
-                # Count recent publications (last 30 days)
+                # Count recent publications (last 30 days), parsing the collection dates in one pass
                 recent_date = datetime.now() - timedelta(days=30)
-                recent_count = 0
-                last_pub_date = None
-                
-                for pub in publications['results'][:50]:  # Check first 50 results
-                    pub_date_str = pub.get('dateofcollection')
-                    if pub_date_str:
-                        try:
-                            pub_date = datetime.strptime(pub_date_str[:10], '%Y-%m-%d')
-                            if pub_date >= recent_date:
-                                recent_count += 1
-                            if not last_pub_date or pub_date > last_pub_date:
-                                last_pub_date = pub_date
-                        except:
-                            pass
+                pub_dates = pd.to_datetime(
+                    pd.Series([(pub.get('dateofcollection') or '')[:10] for pub in publications['results'][:STATS_PUBLICATIONS]]),
+                    format='%Y-%m-%d',
+                    errors='coerce'
+                )
+                recent_count = int((pub_dates >= recent_date).sum())
+                last_pub_date = pub_dates.max().to_pydatetime() if pub_dates.notna().any() else None
                 
                 stats['publications_recent'] = recent_count
                 stats['last_publication_date'] = last_pub_date
@@ -492,7 +674,8 @@ class OpenAIREClient:
                     stats['data_freshness_days'] = (datetime.now() - last_pub_date).days
             
             # Get data sources
-            data_sources = self.get_data_sources(org_id)
+            if data_sources is None:
+                data_sources = data_sources_future.result()
             if data_sources and 'results' in data_sources:
                 stats['data_sources_count'] = len(data_sources['results'])
             
@@ -505,7 +688,7 @@ class OpenAIREClient:
                 else:
                     stats['repository_health'] = 'critical'
             
-            end_time = time.time()
+            end_time = time.monotonic()
             processing_time = round((end_time - start_time) * 1000, 2)
             
             self.logger.info(f"Completed stats collection for {org_id} in {processing_time}ms: "
@@ -520,6 +703,13 @@ class OpenAIREClient:
             self.logger.error(f"Error getting organization stats for {org_id}: {e}")
             return None
     
+    def get_many_organization_stats(self, org_ids):
+        """Get statistics for several organizations, a bounded number at a time, in the order given"""
+        self.get_access_token()
+        # A separate pool: each organization's stats already fan out over self._executor
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as batch_executor:
+            return list(batch_executor.map(self.get_organization_stats, org_ids))
+    
     def test_connection(self):
         """Test the API connection"""
         try:
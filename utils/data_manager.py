@@ -6,6 +6,122 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 import shutil
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+try:
+    import pyarrow.dataset as ds
+except ImportError:
+    ds = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Daily statistics are stored as zstd-compressed Parquet, or as CSV when pyarrow is not installed
+DAILY_FILE_SUFFIX = '.csv' if pq is None else '.parquet'
+
+# Row count of every daily file, kept next to them so system stats need not open each file
+DAILY_INDEX_FILE = "_index.json"
+
+# Daily files read at the same time when loading history (pyarrow decodes outside the GIL)
+HISTORY_READ_WORKERS = 8
+
+# ROR link -> OpenAIRE organization ID, kept between collection runs (the mapping rarely changes)
+ROR_MAP_FILE = "ror_to_openaire.json"
+
+# Buffer size for writing daily CSV files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Integer metrics of the daily data, downcast to the smallest integer type when history is loaded
+INTEGER_COLUMNS = ['publications_total', 'publications_recent', 'data_sources_count']
+
+# Storage types of the numeric daily columns: compact, and the same in every file whatever the day's values
+DAILY_COLUMN_DTYPES = {
+    'publications_total': 'int32',
+    'publications_recent': 'int32',
+    'data_sources_count': 'int32',
+    'data_freshness_days': 'float32'  # Whole days, missing without publications
+}
+
+# Datetime columns of the daily data, stored as timestamps even when a day has no values
+DAILY_DATETIME_COLUMNS = ['timestamp', 'last_publication_date']
+
+# Organization metadata added to each organization's daily statistics (stats key -> organizations file column)
+ORG_METADATA_COLUMNS = {
+    'organization_name': 'full_name_in_English',
+    'acronym': 'acronym_EN',
+    'main_grouping': 'main_grouping',
+    'ror_id': 'ROR',
+    'ror_link': 'ROR_LINK'
+}
+
+def text_mixed_columns(df):
+    """Store mixed-type columns (e.g. ROR links read from Excel) as text, since Arrow columns hold a single type"""
+    for column in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[column], skipna=True).startswith('mixed'):
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    return df
+
+def write_sheet_rows(workbook, sheet_name, df):
+    """Write a frame to a new xlsxwriter sheet one row at a time (constant_memory mode only keeps the current row)"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+    worksheet.write_row(0, 0, df.columns.tolist())
+    
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    for row_number, row in enumerate(rows, start=1):
+        for column_number, value in enumerate(row):
+            if value is None:
+                continue
+            if isinstance(value, datetime):
+                worksheet.write_datetime(row_number, column_number, value, datetime_format)
+            else:
+                worksheet.write(row_number, column_number, value)
+
+def normalize_daily_frame(df):
+    """Give daily statistics their storage types (a missing metric, e.g. from failed stats, stays missing)"""
+    for column in DAILY_DATETIME_COLUMNS:
+        if column in df:
+            df[column] = pd.to_datetime(df[column], format='ISO8601', errors='coerce').astype('datetime64[us]')
+    for column in DAILY_COLUMN_DTYPES:
+        if column in df:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+    df = df.astype({
+        column: dtype for column, dtype in DAILY_COLUMN_DTYPES.items()
+        if column in df and not df[column].hasnans
+    })
+    return text_mixed_columns(df)
+
+def daily_arrow_table(df):
+    """Convert daily statistics to an Arrow table with the fixed storage types (missing metrics become nulls)"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = table.schema
+    for column, dtype in DAILY_COLUMN_DTYPES.items():
+        if column in schema.names:
+            schema = schema.set(schema.get_field_index(column), pa.field(column, pa.from_numpy_dtype(dtype)))
+    return table.cast(schema)
+
+@lru_cache(maxsize=256)
+def read_daily_file_cached(path, mtime_ns, columns=None):
+    """Read a daily statistics file once per modification time (mtime_ns keys the cache, so rewritten files are re-read)"""
+    if path.endswith('.parquet'):
+        if columns is None:
+            return pd.read_parquet(path)
+        # Column projection, tolerating columns missing from older files
+        available = [column for column in pq.read_schema(path).names if column in columns]
+        return pd.read_parquet(path, columns=available)
+    
+    usecols = None if columns is None else (lambda column: column in columns)
+    return pd.read_csv(path, usecols=usecols)
 
 class DataManager:
     """Manages data storage and retrieval for the monitoring system"""
@@ -22,8 +138,12 @@ class DataManager:
         
         self.logger = logging.getLogger(__name__)
         
-        # Load organizations data
+        # Convert daily CSV files left from before Parquet storage
+        self.migrate_csv_to_parquet()
+        
+        # Load organizations data, and the metadata added to their daily statistics by ROR link
         self.organizations_df = self.load_organizations_data()
+        self.org_metadata_by_ror = self.index_org_metadata(self.organizations_df)
     
     def load_organizations_data(self):
         """Load the Dutch organizations data"""
@@ -37,7 +157,21 @@ class DataManager:
                     shutil.copy2(upload_file, org_file)
             
             if org_file.exists():
-                df = pd.read_excel(org_file, engine='openpyxl')
+                # Parsed copy of the spreadsheet, much faster to read than the Excel file itself
+                cache_file = org_file.with_suffix('.feather')
+                if pq is not None and cache_file.exists() and cache_file.stat().st_mtime >= org_file.stat().st_mtime:
+                    df = pd.read_feather(cache_file)
+                else:
+                    df = text_mixed_columns(pd.read_excel(org_file, engine='openpyxl'))
+                    if pq is not None:
+                        try:
+                            df.to_feather(cache_file)
+                        except Exception as e:
+                            self.logger.warning(f"Could not cache organizations data: {e}")
+                
+                # Label rows by ROR link (the column is kept; the index is unnamed so the two never clash)
+                if 'ROR_LINK' in df:
+                    df = df.set_index('ROR_LINK', drop=False).rename_axis(None)
                 self.logger.info(f"Loaded {len(df)} organizations")
                 return df
             else:
@@ -48,18 +182,69 @@ class DataManager:
             self.logger.error(f"Error loading organizations data: {e}")
             return pd.DataFrame()
     
-    def save_daily_data(self, date, org_stats_list):
-        """Save daily statistics for all organizations"""
+    def daily_file_path(self, date):
+        """Get the path of the daily statistics file for a date"""
+        return self.data_dir / "daily" / f"daily_stats_{date.strftime('%Y%m%d')}{DAILY_FILE_SUFFIX}"
+    
+    def list_daily_files(self):
+        """List the daily statistics files"""
+        return list((self.data_dir / "daily").glob(f"daily_stats_*{DAILY_FILE_SUFFIX}"))
+    
+    def migrate_csv_to_parquet(self):
+        """Rewrite daily CSV files as Parquet (oldest first, keeping their order) and remove the CSVs"""
+        if pq is None:
+            return
+        
+        for csv_file in sorted((self.data_dir / "daily").glob("daily_stats_*.csv")):
+            try:
+                parquet_file = csv_file.with_suffix('.parquet')
+                if not parquet_file.exists():
+                    # Same storage types as newly saved files, so old and new files can be scanned together
+                    daily_data = normalize_daily_frame(pd.read_csv(csv_file))
+                    pq.write_table(daily_arrow_table(daily_data), parquet_file, compression='zstd')
+                csv_file.unlink()
+                self.logger.info(f"Migrated {csv_file.name} to Parquet")
+                
+            except Exception as e:
+                self.logger.error(f"Error migrating {csv_file.name} to Parquet: {e}")
+    
+    def index_org_metadata(self, organizations_df):
+        """Map each ROR link to the organization metadata stored with its daily statistics"""
+        missing_columns = [column for column in ORG_METADATA_COLUMNS.values() if column not in organizations_df]
+        if organizations_df.empty or missing_columns:
+            if missing_columns:
+                self.logger.error(f"Organizations data is missing columns: {missing_columns}")
+            return {}
+        
+        # Taken column-wise as plain Python values
+        columns = (organizations_df[column].tolist() for column in ORG_METADATA_COLUMNS.values())
+        return {
+            metadata['ror_link']: metadata
+            for metadata in (dict(zip(ORG_METADATA_COLUMNS, values)) for values in zip(*columns))
+        }
+    
+    def save_daily_data(self, date, org_stats):
+        """Save daily statistics for all organizations (a list of per-organization dicts, or a dict of columns)"""
         try:
-            filename = f"daily_stats_{date.strftime('%Y%m%d')}.csv"
-            filepath = self.data_dir / "daily" / filename
+            filepath = self.daily_file_path(date)
             
             # Convert to DataFrame
-            df = pd.DataFrame(org_stats_list)
+            df = pd.DataFrame(org_stats)
             df['date'] = date.strftime('%Y-%m-%d')
             
-            # Save to CSV
-            df.to_csv(filepath, index=False)
+            df = normalize_daily_frame(df)
+            
+            # Save as Parquet (CSV without pyarrow)
+            if pq is not None:
+                pq.write_table(daily_arrow_table(df), filepath, compression='zstd')
+            else:
+                with open(filepath, 'w', buffering=WRITE_BUFFER_SIZE, newline='') as f:
+                    df.to_csv(f, index=False)
+            
+            # Keep the row-count index in step with the files
+            row_counts = self.load_daily_index()
+            row_counts[filepath.name] = len(df)
+            self.save_daily_index(row_counts)
             self.logger.info(f"Saved daily data to {filepath}")
             return True
             
@@ -67,23 +252,29 @@ class DataManager:
             self.logger.error(f"Error saving daily data: {e}")
             return False
     
-    def load_daily_data(self, date=None):
-        """Load daily data for a specific date or the most recent"""
+    def read_daily_file(self, filepath, columns=None):
+        """Read a daily statistics file, optionally only the given columns (parsed once per file version)"""
+        df = read_daily_file_cached(str(filepath), filepath.stat().st_mtime_ns, None if columns is None else tuple(columns))
+        # Shallow copy: callers may add or replace columns without touching the cached frame
+        return df.copy(deep=False)
+    
+    def load_daily_data(self, date=None, columns=None):
+        """Load daily data for a specific date or the most recent, optionally only the given columns"""
         try:
             if date is None:
                 # Get most recent file
-                daily_files = list((self.data_dir / "daily").glob("daily_stats_*.csv"))
+                daily_files = self.list_daily_files()
                 if not daily_files:
                     return pd.DataFrame()
                 
-                latest_file = max(daily_files, key=os.path.getctime)
-                return pd.read_csv(latest_file)
+                # Dated file names sort chronologically, so no file needs to be stat'ed
+                latest_file = max(daily_files)
+                return self.read_daily_file(latest_file, columns)
             else:
-                filename = f"daily_stats_{date.strftime('%Y%m%d')}.csv"
-                filepath = self.data_dir / "daily" / filename
+                filepath = self.daily_file_path(date)
                 
                 if filepath.exists():
-                    return pd.read_csv(filepath)
+                    return self.read_daily_file(filepath, columns)
                 else:
                     return pd.DataFrame()
                     
@@ -91,48 +282,103 @@ class DataManager:
             self.logger.error(f"Error loading daily data: {e}")
             return pd.DataFrame()
     
-    def get_historical_data(self, days=30):
-        """Get historical data for the last N days"""
+    def get_historical_data(self, days=30, columns=None, org_id=None):
+        """Get historical data for the last N days, optionally only the given columns and one organization's rows
+        
+        Rows come in date order with a datetime 'date' column, so callers need not sort or parse it again.
+        """
         try:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            all_data = []
-            current_date = start_date
+            # One directory listing; dated file names compare (and sort) chronologically
+            first_day, last_day = start_date.strftime('%Y%m%d'), end_date.strftime('%Y%m%d')
+            daily_files = sorted(
+                filepath for filepath in self.list_daily_files()
+                if first_day <= filepath.stem[-8:] <= last_day
+            )
+            
+            # The date is stored in every file, so it is always read along with the requested columns
+            if columns is not None and 'date' not in columns:
+                columns = [*columns, 'date']
+            
+            if org_id is not None and ds is not None and daily_files and DAILY_FILE_SUFFIX == '.parquet':
+                historical_data = self.scan_daily_files(daily_files, columns, org_id)
+                if historical_data is not None:
+                    return historical_data
             
-            while current_date <= end_date:
-                daily_data = self.load_daily_data(current_date)
+            # Filtering per file needs the org_id column, even when it is not requested
+            read_columns = columns
+            if org_id is not None and columns is not None and 'org_id' not in columns:
+                read_columns = [*columns, 'org_id']
+            
+            # Read the files concurrently, then go through them in date order
+            with ThreadPoolExecutor(max_workers=HISTORY_READ_WORKERS) as executor:
+                futures = [executor.submit(self.read_daily_file, filepath, read_columns) for filepath in daily_files]
+            
+            all_data = []
+            for filepath, future in zip(daily_files, futures):
+                try:
+                    daily_data = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error loading daily data from {filepath.name}: {e}")
+                    continue
+                
+                if org_id is not None and not daily_data.empty:
+                    # Keep only this organization's rows per file, before anything is concatenated
+                    # (older files may lack some requested columns, which the read already left out)
+                    org_rows = daily_data['org_id'].to_numpy() == org_id
+                    if columns is None:
+                        daily_data = daily_data[org_rows]
+                    else:
+                        daily_data = daily_data.loc[org_rows, [column for column in columns if column in daily_data]]
                 if not daily_data.empty:
-                    daily_data['date'] = current_date.strftime('%Y-%m-%d')
                     all_data.append(daily_data)
-                current_date += timedelta(days=1)
             
-            if all_data:
-                return pd.concat(all_data, ignore_index=True)
-            else:
+            if not all_data:
                 return pd.DataFrame()
+            
+            return self.finish_historical_data(pd.concat(all_data, ignore_index=True))
                 
         except Exception as e:
             self.logger.error(f"Error getting historical data: {e}")
             return pd.DataFrame()
     
+    def scan_daily_files(self, daily_files, columns, org_id):
+        """Read one organization's rows from the given Parquet files as a single Arrow dataset
+        
+        The org_id filter and column projection are pushed down to Arrow, so only matching row groups
+        and the requested columns are read (org_id itself need not be one of them). Returns None when the files cannot be scanned together
+        (e.g. a damaged file or differing schemas), so the caller can fall back to per-file reads.
+        """
+        try:
+            dataset = ds.dataset([str(filepath) for filepath in daily_files], format='parquet')
+            table = dataset.to_table(columns=columns, filter=ds.field('org_id') == org_id)
+            
+        except Exception as e:
+            self.logger.error(f"Error scanning daily files, reading them one by one: {e}")
+            return None
+        
+        if table.num_rows == 0:
+            return pd.DataFrame()
+        # Fragments may be read in parallel, so restore the date order of the per-file path
+        historical_data = self.finish_historical_data(table.to_pandas())
+        return historical_data.sort_values('date', kind='stable', ignore_index=True)
+    
+    def finish_historical_data(self, historical_data):
+        """Parse the date column and downcast the integer metrics of concatenated history"""
+        historical_data['date'] = pd.to_datetime(historical_data['date'], format='%Y-%m-%d')
+        for column in INTEGER_COLUMNS:
+            if column in historical_data:
+                historical_data[column] = pd.to_numeric(historical_data[column], downcast='integer')
+        
+        return historical_data
+    
     def get_organization_trend(self, org_id, metric='publications_total', days=30):
         """Get trend data for a specific organization and metric"""
         try:
-            historical_data = self.get_historical_data(days)
-            if historical_data.empty:
-                return pd.DataFrame()
-            
-            org_data = historical_data[historical_data['org_id'] == org_id]
-            if org_data.empty:
-                return pd.DataFrame()
-            
-            # Sort by date and get the specified metric
-            org_data = org_data.sort_values('date')
-            trend_data = org_data[['date', metric]].copy()
-            trend_data['date'] = pd.to_datetime(trend_data['date'])
-            
-            return trend_data
+            # Already filtered, projected and in date order with datetime dates
+            return self.get_historical_data(days, columns=['date', metric], org_id=org_id)
             
         except Exception as e:
             self.logger.error(f"Error getting organization trend: {e}")
@@ -146,42 +392,51 @@ class DataManager:
                 return False
             
             today = datetime.now().date()
-            org_stats_list = []
             
             self.logger.info(f"Starting daily data collection for {len(self.organizations_df)} organizations")
             
-            for idx, org in self.organizations_df.iterrows():
-                try:
-                    # Get OpenAIRE org ID
-                    ror_link = org['ROR_LINK']
-                    org_id = api_client.get_organization_id(ror_link)
-                    
-                    if org_id:
-                        # Get organization statistics
-                        stats = api_client.get_organization_stats(org_id)
-                        if stats:
-                            # Add organization metadata
-                            stats.update({
-                                'organization_name': org['full_name_in_English'],
-                                'acronym': org['acronym_EN'],
-                                'main_grouping': org['main_grouping'],
-                                'ror_id': org['ROR'],
-                                'ror_link': ror_link
-                            })
-                            org_stats_list.append(stats)
-                            
-                    # Small delay to avoid overwhelming the API
-                    import time
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error collecting data for {org['acronym_EN']}: {e}")
-                    continue
+            org_metadata = list(self.org_metadata_by_ror.values())
+            
+            # Resolve the OpenAIRE org IDs first: known ones from the stored mapping, the rest several
+            # lookups at a time (the client bounds the concurrency and backs off when the API answers 429)
+            ror_links = [metadata['ror_link'] for metadata in org_metadata]
+            ror_map_file = self.data_dir / ROR_MAP_FILE
+            ror_map = self.load_json_file(ror_map_file)
+            unresolved_links = [ror_link for ror_link in ror_links if ror_link not in ror_map]
+            
+            if unresolved_links:
+                self.logger.info(f"Looking up OpenAIRE IDs for {len(unresolved_links)} organizations")
+                found_ids = api_client.get_many_organization_ids(unresolved_links)
+                ror_map.update(
+                    (ror_link, org_id) for ror_link, org_id in zip(unresolved_links, found_ids)
+                    if org_id and isinstance(ror_link, str)
+                )
+            
+            org_ids = [ror_map.get(ror_link) for ror_link in ror_links]
+            orgs_with_ids = [(metadata, org_id) for metadata, org_id in zip(org_metadata, org_ids) if org_id]
+            
+            # Get organization statistics, several organizations at a time
+            all_stats = api_client.get_many_organization_stats([org_id for _, org_id in orgs_with_ids])
+            collected = [(metadata, stats) for (metadata, _), stats in zip(orgs_with_ids, all_stats) if stats]
             
-            # Save the collected data
-            if org_stats_list:
-                success = self.save_daily_data(datetime.now(), org_stats_list)
-                self.logger.info(f"Collected data for {len(org_stats_list)} organizations")
+            # Keep the mapping for the next run, dropping IDs that returned no statistics so they are looked up again
+            for (metadata, _), stats in zip(orgs_with_ids, all_stats):
+                if not stats:
+                    ror_map.pop(metadata['ror_link'], None)
+            self.save_json_file(ror_map_file, ror_map)
+            
+            # Save the collected data, built column by column (statistics, then organization metadata)
+            if collected:
+                org_stats_columns = {
+                    key: [stats.get(key) for _, stats in collected]
+                    for key in collected[0][1]
+                }
+                org_stats_columns.update({
+                    key: [metadata[key] for metadata, _ in collected]
+                    for key in ORG_METADATA_COLUMNS
+                })
+                success = self.save_daily_data(datetime.now(), org_stats_columns)
+                self.logger.info(f"Collected data for {len(collected)} organizations")
                 return success
             else:
                 self.logger.warning("No data collected")
@@ -194,17 +449,51 @@ class DataManager:
     def get_last_update_time(self):
         """Get the timestamp of the last data update"""
         try:
-            daily_files = list((self.data_dir / "daily").glob("daily_stats_*.csv"))
+            daily_files = self.list_daily_files()
             if not daily_files:
                 return None
             
-            latest_file = max(daily_files, key=os.path.getctime)
+            # Latest file by its dated name; only that file is stat'ed, for the time of day it was written
+            latest_file = max(daily_files)
             return datetime.fromtimestamp(os.path.getctime(latest_file))
             
         except Exception as e:
             self.logger.error(f"Error getting last update time: {e}")
             return None
     
+    def load_json_file(self, filepath):
+        """Load a JSON mapping kept in the data directory (empty when the file does not exist yet)"""
+        try:
+            with open(filepath) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def save_json_file(self, filepath, data):
+        """Write a JSON mapping atomically, so readers never see a partial file"""
+        try:
+            tmp_file = filepath.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, filepath)
+            
+        except Exception as e:
+            self.logger.error(f"Error saving {filepath.name}: {e}")
+    
+    def load_daily_index(self):
+        """Load the row count of each daily file, by file name (empty when there is no index yet)"""
+        return self.load_json_file(self.data_dir / "daily" / DAILY_INDEX_FILE)
+    
+    def save_daily_index(self, row_counts):
+        """Write the daily row-count index"""
+        self.save_json_file(self.data_dir / "daily" / DAILY_INDEX_FILE, row_counts)
+    
+    def count_daily_rows(self, filepath):
+        """Count the rows of a daily file (from the Parquet footer, without reading the data)"""
+        if filepath.suffix == '.parquet':
+            return pq.read_metadata(filepath).num_rows
+        return len(self.read_daily_file(filepath))
+    
     def get_system_stats(self):
         """Get overall system statistics"""
         try:
@@ -214,17 +503,24 @@ class DataManager:
                 'days_of_data': 0
             }
             
-            # Count data points
-            daily_files = list((self.data_dir / "daily").glob("daily_stats_*.csv"))
+            # Count data points from the row-count index, only counting files it does not cover yet
+            daily_files = self.list_daily_files()
+            row_counts = self.load_daily_index()
             total_points = 0
+            index_changed = False
             
             for file in daily_files:
                 try:
-                    df = pd.read_csv(file)
-                    total_points += len(df)
+                    if file.name not in row_counts:
+                        row_counts[file.name] = self.count_daily_rows(file)
+                        index_changed = True
+                    total_points += row_counts[file.name]
                 except:
                     pass
             
+            if index_changed:
+                self.save_daily_index(row_counts)
+            
             stats['total_data_points'] = total_points
             stats['days_of_data'] = len(daily_files)
             
@@ -241,20 +537,38 @@ class DataManager:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             export_file = export_dir / f"full_export_{timestamp}.xlsx"
             
-            with pd.ExcelWriter(export_file, engine='openpyxl') as writer:
-                # Export organizations
-                if not self.organizations_df.empty:
-                    self.organizations_df.to_excel(writer, sheet_name='Organizations', index=False)
-                
-                # Export recent daily data
-                recent_data = self.get_historical_data(30)
+            sheets = {}
+            
+            # Export organizations
+            if not self.organizations_df.empty:
+                sheets['Organizations'] = self.organizations_df
+            
+            # Load 90 days once; the recent data is its last 30 days
+            historical_data = self.get_historical_data(90)
+            
+            # Export recent daily data
+            if not historical_data.empty:
+                recent_start = pd.Timestamp((datetime.now() - timedelta(days=30)).date())
+                recent_data = historical_data[historical_data['date'] >= recent_start]
                 if not recent_data.empty:
-                    recent_data.to_excel(writer, sheet_name='Recent_Data', index=False)
-                
-                # Export historical summary
-                historical_data = self.get_historical_data(90)
-                if not historical_data.empty:
-                    historical_data.to_excel(writer, sheet_name='Historical_Data', index=False)
+                    sheets['Recent_Data'] = recent_data
+            
+            # Export historical summary
+            if not historical_data.empty:
+                sheets['Historical_Data'] = historical_data
+            
+            # Stream rows to disk with xlsxwriter when available, instead of building the workbook in memory
+            if xlsxwriter is not None:
+                workbook = xlsxwriter.Workbook(str(export_file), {'constant_memory': True})
+                try:
+                    for sheet_name, df in sheets.items():
+                        write_sheet_rows(workbook, sheet_name, df)
+                finally:
+                    workbook.close()
+            else:
+                with pd.ExcelWriter(export_file, engine='openpyxl') as writer:
+                    for sheet_name, df in sheets.items():
+                        df.to_excel(writer, sheet_name=sheet_name, index=False)
             
             return str(export_file)
             
@@ -265,17 +579,27 @@ class DataManager:
     def clean_old_data(self, days_to_keep=90):
         """Clean data older than specified days"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            daily_dir = self.data_dir / "daily"
+            cutoff_day = (datetime.now() - timedelta(days=days_to_keep)).strftime('%Y%m%d')
+            
+            # The collection date is in the file name, so no stat() is needed; oldest first, stop at the first kept file
+            daily_files = sorted(self.list_daily_files())
+            removed_names = set()
+            for file in daily_files:
+                if file.stem[-8:] >= cutoff_day:
+                    break
+                try:
+                    file.unlink(missing_ok=True)
+                    removed_names.add(file.name)
+                except OSError as e:
+                    self.logger.error(f"Error removing {file.name}: {e}")
             
-            cleaned_count = 0
-            for file in daily_dir.glob("daily_stats_*.csv"):
-                file_date = datetime.fromtimestamp(os.path.getctime(file))
-                if file_date < cutoff_date:
-                    file.unlink()
-                    cleaned_count += 1
+            # Keep the row-count index to the files that are left
+            kept_names = {file.name for file in daily_files} - removed_names
+            row_counts = self.load_daily_index()
+            if row_counts.keys() - kept_names:
+                self.save_daily_index({name: rows for name, rows in row_counts.items() if name in kept_names})
             
-            return cleaned_count
+            return len(removed_names)
             
         except Exception as e:
             self.logger.error(f"Error cleaning old data: {e}")